@@ -362,20 +362,22 @@ class ExporterHandler(BaseHandler):
             else:
                 result = func(parser, pargs, *args, **kwargs)
 
-                for item in result:
-                    if callable(item["text"]):
-                        text = item["text"]()
-                    else:
-                        text = item["text"]
-                    if pargs.print:
-                        console(text)
-
-                    if pargs.write:
-                        out_path = os.path.join(out_dir, fix_path(item["out_file"]))
-
-                        console('Writing data to "%s"...' % out_path)
-                        with open(out_path, "w", encoding="utf-8") as f:
-                            f.write(text)
+                # Rendering the text can be expensive, so skip it when nothing is output here
+                if pargs.print or pargs.write:
+                    for item in result:
+                        if callable(item["text"]):
+                            text = item["text"]()
+                        else:
+                            text = item["text"]
+                        if pargs.print:
+                            console(text)
+
+                        if pargs.write:
+                            out_path = os.path.join(out_dir, fix_path(item["out_file"]))
+
+                            console('Writing data to "%s"...' % out_path)
+                            with open(out_path, "w", encoding="utf-8") as f:
+                                f.write(text)
 
                 if pargs.wiki:
                     if mwclient is None:
@@ -1429,19 +1429,22 @@ class BaseParser:
         self.lang = config.get_option("language")
 
     def _column_index_filter(self, dat_file_name, column_id, arg_list, error_msg=_MISSING_MSG):
-        self.rr[dat_file_name].build_index(column_id)
+        dat_file = self.rr[dat_file_name]
+        if column_id not in dat_file.index:
+            dat_file.build_index(column_id)
+        index = dat_file.index[column_id]
 
         rows = []
         missing = []
 
-        if column_id in self.rr[dat_file_name].columns_unique:
+        if column_id in dat_file.columns_unique:
             func = rows.append
         else:
             func = rows.extend
 
         for argument in arg_list:
-            if argument in self.rr[dat_file_name].index[column_id]:
-                func(self.rr[dat_file_name].index[column_id][argument])
+            if argument in index:
+                func(index[argument])
             else:
                 missing.append(argument)
 
@@ -1475,6 +1478,9 @@ class BaseParser:
             out_img.save(out_path.replace(".dds", parsed_args.convert_images))
 
             console('Converted "%s" to png' % out_path)
+
+            # Hand the decoded image back so callers don't need to read the file again
+            return out_img
         else:
             with open(out_path, "wb") as f:
                 f.write(self.file_system.extract_dds(data))
@@ -1732,6 +1738,8 @@ class TagHandler:
 
 
 class WikiCondition:
+    __slots__ = ("data", "cmdargs", "handler", "template_arguments")
+
     COPY_KEYS = ()
     COPY_MATCH = None
     COPY_CONDITIONS: dict[str, Callable[[str, str], bool]] = {}
@@ -1761,22 +1769,21 @@ class WikiCondition:
 
                 return True
 
+            kwargs = self.template_arguments["kwargs"]
+            # COPY_KEYS stays ordered as it determines the order of the copied arguments;
+            # most keys are usually missing, so test membership rather than catching KeyError
             for k in self.COPY_KEYS:
-                try:
-                    self.data[k] = self.template_arguments["kwargs"][k]
-                except KeyError:
-                    pass
+                if k in kwargs:
+                    self.data[k] = kwargs[k]
 
             if self.COPY_MATCH:
-                for k, v in self.template_arguments["kwargs"].items():
+                for k, v in kwargs.items():
                     if self.COPY_MATCH.match(k):
                         self.data[k] = v
 
             for k, condition in self.COPY_CONDITIONS.items():
-                if k in self.template_arguments["kwargs"] and condition(
-                    self.template_arguments["kwargs"][k], self.data.get(k, None)
-                ):
-                    self.data[k] = self.template_arguments["kwargs"][k]
+                if k in kwargs and condition(kwargs[k], self.data.get(k, None)):
+                    self.data[k] = kwargs[k]
 
             prefix = ""
             if self.ADD_INCLUDE and "<onlyinclude></onlyinclude>" not in page.text():
@@ -37,15 +37,22 @@ import os
 # Python
 import re
 import warnings
-from collections import OrderedDict, defaultdict
-from functools import partialmethod
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import cached_property, lru_cache, partialmethod
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 
 # 3rd-party
+from dds import decode_dds
 from PIL import Image, ImageOps
 
 from PyPoE.cli.core import Msg, console
 from PyPoE.cli.exporter import config
+from PyPoE.cli.exporter.util import fix_path
 from PyPoE.cli.exporter.wiki import parser
 from PyPoE.cli.exporter.wiki.handler import ExporterHandler, ExporterResult
 from PyPoE.cli.exporter.wiki.parsers.itemconstants import (
@@ -61,25 +68,47 @@ from PyPoE.poe.file.dat import RelationalReader
 from PyPoE.poe.file.it import ITFile
 from PyPoE.poe.sim.formula import GemTypes, gem_stat_requirement
 
+# =============================================================================
+# Globals
+# =============================================================================
+
+_get_id = itemgetter("Id")
+
+# AtlasNode.dat tier columns paired with the infobox key for each atlas region
+_ATLAS_TIER_KEYS = tuple((f"Tier{i}", f"atlas_map_tier{i}") for i in range(5))
+
 # =============================================================================
 # Functions
 # =============================================================================
 
 
+def _compile_column_map(column_map):
+    """
+    Flattens a column map of (column, {template, condition, format}) pairs into
+    (column, template, condition, format) tuples so the optional entries are
+    only resolved once instead of for every exported row.
+    """
+    return tuple(
+        (k, data["template"], data.get("condition"), data.get("format")) for k, data in column_map
+    )
+
+
 def _apply_column_map(infobox, column_map, list_object):
-    for k, data in column_map:
+    for k, template, condition, formatter in column_map:
         value = list_object[k]
-        if data.get("condition") and not data["condition"](value):
+        if condition and not condition(value):
             continue
 
-        if data.get("format"):
-            value = data["format"](value)
-        infobox[data["template"]] = value
+        if formatter:
+            value = formatter(value)
+        infobox[template] = value
 
 
 def _type_factory(
     data_file, data_mapping, row_index=True, function=None, fail_condition=False, skip_warning=False
 ):
+    data_mapping = _compile_column_map(data_mapping)
+
     def func(self, infobox, base_item_type):
         try:
             if data_file == "BaseItemTypes.dat64":
@@ -114,11 +143,50 @@ def _simple_conflict_factory(data):
     return _conflict_handler
 
 
+def _name_decoration_map(overrides, appendixes, no_appendixes):
+    # Merge the name tables into language -> id -> (override, appendix), so resolving an item's
+    # name only takes a single lookup
+    languages = overrides.keys() | appendixes.keys() | no_appendixes.keys()
+    decorations = {}
+    for language in languages:
+        language_overrides = overrides.get(language, {})
+        language_appendixes = appendixes.get(language, {})
+        decorations[language] = {
+            m_id: (language_overrides.get(m_id), language_appendixes.get(m_id))
+            for m_id in language_overrides.keys() | language_appendixes.keys()
+        }
+        for m_id in no_appendixes.get(language, ()):
+            decorations[language][m_id] = (language_overrides.get(m_id), "")
+
+    return MappingProxyType(
+        {language: MappingProxyType(table) for language, table in decorations.items()}
+    )
+
+
+def _part_appendixes(of, parts):
+    # Number every part of multi-part items, e.g. " (2 of 3)"
+    return {
+        f"{prefix}{i}": f" ({of % (i, total)})"
+        for prefix, total in parts.items()
+        for i in range(1, total + 1)
+    }
+
+
+@lru_cache(maxsize=None)
+def _colorize_lut(black, white, mid, blackpoint, whitepoint, midpoint):
+    # Colorize a 0-255 gradient once to obtain the lookup table ImageOps.colorize would build
+    gradient = Image.frombytes("L", (256, 1), bytes(range(256)))
+    ret = ImageOps.colorize(gradient, black, white, mid, blackpoint, whitepoint, midpoint)
+    return tuple(b"".join(channel.tobytes() for channel in ret.split()))
+
+
 def _colorize_rgba(img, black, white, mid=None, blackpoint=0, whitepoint=255, midpoint=127):
     img_a = img.getchannel("A")
     img_gray = ImageOps.grayscale(img)
 
-    ret = ImageOps.colorize(img_gray, black, white, mid, blackpoint, whitepoint, midpoint)
+    ret = img_gray.convert("RGB").point(
+        _colorize_lut(black, white, mid, blackpoint, whitepoint, midpoint)
+    )
     ret.putalpha(img_a)
     return ret
 
@@ -129,6 +197,8 @@ def _colorize_rgba(img, black, white, mid=None, blackpoint=0, whitepoint=255, mi
 
 
 class WikiCondition(parser.WikiCondition):
+    __slots__ = ()
+
     COPY_KEYS = (
         # for skills
         "radius",
@@ -180,30 +250,11 @@ class WikiCondition(parser.WikiCondition):
         "prophecy_objective",
         "prophecy_reward",
         # Quest Rewards
-        "quest_reward1_type",
-        "quest_reward1_quest",
-        "quest_reward1_quest_id",
-        "quest_reward1_act",
-        "quest_reward1_class_ids",
-        "quest_reward1_npc",
-        "quest_reward2_type",
-        "quest_reward2_quest",
-        "quest_reward2_quest_id",
-        "quest_reward2_act",
-        "quest_reward2_class_ids",
-        "quest_reward2_npc",
-        "quest_reward3_type",
-        "quest_reward3_quest",
-        "quest_reward3_quest_id",
-        "quest_reward3_act",
-        "quest_reward3_class_ids",
-        "quest_reward3_npc",
-        "quest_reward4_type",
-        "quest_reward4_quest",
-        "quest_reward4_quest_id",
-        "quest_reward4_act",
-        "quest_reward4_class_ids",
-        "quest_reward4_npc",
+        *(
+            f"quest_reward{i}_{key}"
+            for i in range(1, 5)
+            for key in ("type", "quest", "quest_id", "act", "class_ids", "npc")
+        ),
         # Sentinels
         "sentinel_duration",
         "sentinel_empowers",
@@ -212,12 +263,7 @@ class WikiCondition(parser.WikiCondition):
         "sentinel_monster_level",
         "sentinel_charge",
     )
-    COPY_MATCH = re.compile(
-        r"^(recipe|sell_price|implicit[0-9]+_(?:text|random_list)).*", re.UNICODE
-    )
-    COPY_MATCH = re.compile(
-        r"^(recipe|sell_price|implicit[0-9]+_(?:text|random_list)).*", re.UNICODE
-    )
+    COPY_MATCH = re.compile(r"^(recipe|sell_price|implicit[0-9]+_(?:text|random_list))")
 
     NAME = "Base item"
     INDENT = 40
@@ -225,19 +271,23 @@ class WikiCondition(parser.WikiCondition):
 
 
 class ItemWikiCondition(WikiCondition):
-    NAME = "Base item"
+    __slots__ = ()
 
 
 class MapItemWikiCondition(WikiCondition):
-    NAME = "Base item"
+    __slots__ = ()
 
 
 class UniqueMapItemWikiCondition(MapItemWikiCondition):
+    __slots__ = ()
+
     NAME = "Item"
-    COPY_MATCH = re.compile(r"^(recipe|(ex|im)plicit[0-9]+_(?:text|random_list)).*", re.UNICODE)
+    COPY_MATCH = re.compile(r"^(recipe|(ex|im)plicit[0-9]+_(?:text|random_list))")
 
 
 class ProphecyWikiCondition(WikiCondition):
+    __slots__ = ()
+
     NAME = "Item"
 
 
@@ -273,6 +323,7 @@ class ItemsHandler(ExporterHandler):
             "--filter-name",
             help="Filter by item name using regular expression.",
             dest="re_name",
+            type=re.compile,
         )
 
         item_filter_parser.add_argument(
@@ -281,6 +332,7 @@ class ItemsHandler(ExporterHandler):
             "--filter-metadata-id",
             help="Filter by item metadata id using regular expression",
             dest="re_id",
+            type=re.compile,
         )
 
         #
@@ -336,6 +388,18 @@ class ItemsHandler(ExporterHandler):
             dest="map_series_id",
         )
 
+    def add_image_arguments(self, parser):
+        super().add_image_arguments(parser)
+        parser.add_argument(
+            "-im-t",
+            "--image-threads",
+            help="Number of threads used to convert images. Only used with --convert-images.",
+            action="store",
+            type=int,
+            default=1,
+            dest="image_threads",
+        )
+
     def add_default_parsers(self, *args, type=None, **kwargs):
         super().add_default_parsers(*args, **kwargs)
         parser = kwargs["parser"]
@@ -377,8 +441,6 @@ class ItemsHandler(ExporterHandler):
 
 
 class ItemsParser(SkillParserShared):
-    _regex_format = re.compile(r"(?P<index>x|y|z)" r"(?:[\W]*)" r"(?P<tag>%|second)", re.IGNORECASE)
-
     # Core files we need to load
     _files = [
         "BaseItemTypes.dat64",
@@ -399,8 +461,8 @@ class ItemsParser(SkillParserShared):
     )
 
     _MAP_COLORS = {
-        "mid tier": "255,210,100",
-        "high tier": "240,30,10",
+        "mid tier": (255, 210, 100),
+        "high tier": (240, 30, 10),
     }
 
     # Midpoint values are the luminosities of _MAP_COLORS entries
@@ -430,13 +492,13 @@ class ItemsParser(SkillParserShared):
         "Ancestral": "3.22.0",  # AKA Trial of the Ancestors
     }
 
-    _IGNORE_DROP_LEVEL_CLASSES = (
+    _IGNORE_DROP_LEVEL_CLASSES = {
         "HideoutDoodad",
         "Microtransaction",
         "LabyrinthItem",
         "LabyrinthTrinket",
         "LabyrinthMapItem",
-    )
+    }
 
     _IGNORE_DROP_LEVEL_ITEMS_BY_ID = {
         # Alchemy Shard
@@ -532,179 +594,36 @@ class ItemsParser(SkillParserShared):
         }
     }
 
+    # Items that come in several parts, by id prefix and number of parts
+    _UNIQUE_FRAGMENT_PARTS = {
+        "Metadata/Items/UniqueFragments/FragmentUniqueShield1_": 4,
+        "Metadata/Items/UniqueFragments/FragmentUniqueSword1_": 3,
+        "Metadata/Items/UniqueFragments/FragmentUniqueStaff1_": 3,
+        "Metadata/Items/UniqueFragments/FragmentUniqueBelt1_": 2,
+        "Metadata/Items/UniqueFragments/FragmentUniqueQuiver1_": 3,
+        "Metadata/Items/UniqueFragments/FragmentUniqueHelmet1_": 3,
+    }
+
+    _GOLDEN_PAGE_PARTS = {"Metadata/Items/QuestItems/GoldenPages/Page": 4}
+
+    _MAP_UPGRADE_PARTS = {
+        "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier8_": 2,
+        "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier9_": 3,
+        "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier10_": 3,
+    }
+
+    _ATLAS_REGION_UPGRADE_PARTS = {
+        f"Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade{region}_": 8 for region in range(1, 5)
+    }
+
+    # Mystery boxes are told apart by their size in every language
+    _MYSTERY_BOX_APPENDIX_BY_ID = {
+        f"Metadata/Items/MicrotransactionCurrency/MysteryBox{size}": f" ({size})"
+        for size in ("1x1", "1x2", "1x3", "1x4", "2x1", "2x2", "2x3", "2x4", "3x2", "3x3")
+    }
+
     _NAME_APPENDIX_BY_ID = {
         "English": {
-            # =================================================================
-            # Skill Gems
-            # =================================================================
-            "Metadata/Items/Gems/SkillGemChargedAttack": "",
-            "Metadata/Items/Gems/SkillGemCyclone": "",
-            "Metadata/Items/Gems/SkillGemDualStrike": "",
-            "Metadata/Items/Gems/SkillGemLacerate": "",
-            "Metadata/Items/Gems/SkillGemBladestorm": "",
-            "Metadata/Items/Gems/SkillGemChainHook": "",
-            "Metadata/Items/Gems/SkillGemEarthquake": "",
-            "Metadata/Items/Gems/SkillGemMeleeTotem": "",
-            "Metadata/Items/Gems/SkillGemAncestralWarchief": "",
-            "Metadata/Items/Gems/SkillGemGeneralsCry": "",
-            "Metadata/Items/Gems/SkillGemLeapSlam": "",
-            "Metadata/Items/Gems/SkillGemShieldCharge": "",
-            "Metadata/Items/Gems/SkillGemChargedDash": "",
-            "Metadata/Items/Gems/SkillGemGlacialHammer": "",
-            "Metadata/Items/Gems/SkillGemIceCrash": "",
-            "Metadata/Items/Gems/SkillGemMoltenStrike": "",
-            "Metadata/Items/Gems/SkillGemSmite": "",
-            "Metadata/Items/Gems/SkillGemThrownShieldProjectile": "",
-            "Metadata/Items/Gems/SkillGemThrownWeapon": "",
-            "Metadata/Items/Gems/SkillGemVenomGyre": "",
-            "Metadata/Items/Gems/SkillGemWhirlingBlades": "",
-            "Metadata/Items/Gems/SkillGemPuncture": "",
-            "Metadata/Items/Gems/SkillGemRainOfArrows": "",
-            "Metadata/Items/Gems/SkillGemScourgeArrow": "",
-            "Metadata/Items/Gems/SkillGemToxicRain": "",
-            "Metadata/Items/Gems/SkillGemBlinkArrow": "",
-            "Metadata/Items/Gems/SkillGemEnsnaringArrow": "",
-            "Metadata/Items/Gems/SkillGemBlastRain": "",
-            "Metadata/Items/Gems/SkillGemElementalHit": "",
-            "Metadata/Items/Gems/SkillGemBladeBlast": "",
-            "Metadata/Items/Gems/SkillGemBladeVortex": "",
-            "Metadata/Items/Gems/SkillGemBladefall": "",
-            "Metadata/Items/Gems/SkillGemBloodreap": "",
-            "Metadata/Items/Gems/SkillGemVoidSphere": "",
-            "Metadata/Items/Gems/SkillGemDivineTempest": "",
-            "Metadata/Items/Gems/SkillGemFirestorm": "",
-            "Metadata/Items/Gems/SkillGemFrostBolt": "",
-            "Metadata/Items/Gems/SkillGemIceNova": "",
-            "Metadata/Items/Gems/SkillGemLightningTendrils": "",
-            "Metadata/Items/Gems/SkillGemSanctify": "",
-            "Metadata/Items/Gems/SkillGemMagmaOrb": "",
-            "Metadata/Items/Gems/SkillGemStormCall": "",
-            "Metadata/Items/Gems/SkillGemCorpseEruption": "",
-            "Metadata/Items/Gems/SkillGemFrostBomb": "",
-            "Metadata/Items/Gems/SkillGemHydrosphere": "",
-            "Metadata/Items/Gems/SkillGemPurge": "",
-            "Metadata/Items/Gems/SkillGemBlight": "",
-            "Metadata/Items/Gems/SkillGemEssenceDrain": "",
-            "Metadata/Items/Gems/SkillGemArcticBreath": "",
-            "Metadata/Items/Gems/SkillGemFrostBoltNova": "",
-            "Metadata/Items/Gems/SkillGemFlameTotem": "",
-            "Metadata/Items/Gems/SkillGemArtilleryBallista": "",
-            "Metadata/Items/Gems/SkillGemSiegeBallista": "",
-            "Metadata/Items/Gems/SkillGemFireTrap": "",
-            "Metadata/Items/Gems/SkillGemIceTrap": "",
-            "Metadata/Items/Gems/SkillGemLightningTrap": "",
-            "Metadata/Items/Gems/SkillGemIceSiphonTrap": "",
-            "Metadata/Items/Gems/SkillGemFlamethrowerTrap": "",
-            "Metadata/Items/Gems/SkillGemLightningTowerTrap": "",
-            "Metadata/Items/Gems/SkillGemPrecision": "",
-            "Metadata/Items/Gems/SkillGemVitality": "",
-            "Metadata/Items/Gems/SkillGemClarity": "",
-            "Metadata/Items/Gems/SkillGemBloodAndSand": "",
-            "Metadata/Items/Gems/SkillGemDash": "",
-            "Metadata/Items/Gems/SkillGemDesecrate": "",
-            "Metadata/Items/Gems/SkillGemPhaseRun": "",
-            "Metadata/Items/Gems/SkillGemPoachersMark": "",
-            "Metadata/Items/Gems/SkillGemCriticalWeakness": "",
-            "Metadata/Items/Gems/SkillGemWarlordsMark": "",
-            "Metadata/Items/Gems/SkillGemElementalWeakness": "",
-            "Metadata/Items/Gems/SkillGemNewVulnerability": "",
-            "Metadata/Items/Gems/SkillGemVulnerability": "",
-            "Metadata/Items/Gems/SkillGemEnduringCry": "",
-            "Metadata/Items/Gems/SkillGemRejuvenationTotem": "",
-            "Metadata/Items/Gems/SkillGemLightningWarp": "",
-            "Metadata/Items/Gems/SkillGemFlameDash": "",
-            "Metadata/Items/Gems/SkillGemFrostblink": "",
-            "Metadata/Items/Gems/SkillGemSmokeMine": "",
-            "Metadata/Items/Gems/SkillGemSearingBond": "",
-            "Metadata/Items/Gems/SkillGemShockwaveTotem": "",
-            "Metadata/Items/Gems/SkillGemBurningArrow": "",
-            "Metadata/Items/Gems/SkillGemPoisonArrow": "",
-            "Metadata/Items/Gems/SkillGemShrapnelShot": "",
-            "Metadata/Items/Gems/SkillGemSummonSkeletons": "",
-            "Metadata/Items/Gems/SkillGemSummonRagingSpirit": "",
-            "Metadata/Items/Gems/SkillGemDetonateDead": "",
-            "Metadata/Items/Gems/SkillGemEtherealKnives": "",
-            "Metadata/Items/Gems/SkillGemBoneLance": "",
-            "Metadata/Items/Gems/SkillGemBallLightning": "",
-            "Metadata/Items/Gems/SkillGemBlazingSalvo": "",
-            "Metadata/Items/Gems/SkillGemColdSnap": "",
-            "Metadata/Items/Gems/SkillGemDarkPact": "",
-            "Metadata/Items/Gems/SkillGemFireball": "",
-            "Metadata/Items/Gems/SkillGemGlacialCascade": "",
-            "Metadata/Items/Gems/SkillGemFrostBlades": "",
-            "Metadata/Items/Gems/SkillGemShatteringSteel": "",
-            "Metadata/Items/Gems/SkillGemWildStrike": "",
-            "Metadata/Items/Gems/SkillGemCleave": "",
-            "Metadata/Items/Gems/SkillGemDominatingBlow": "",
-            "Metadata/Items/Gems/SkillGemInfernalBlow": "",
-            "Metadata/Items/Gems/SkillGemSunder": "",
-            "Metadata/Items/Gems/SkillGemLightningArrow": "",
-            "Metadata/Items/Gems/SkillGemExplosiveArrow": "",
-            "Metadata/Items/Gems/SkillGemViperStrike": "",
-            "Metadata/Items/Gems/SkillGemSweep": "",
-            "Metadata/Items/Gems/SkillGemIncinerate": "",
-            "Metadata/Items/Gems/SkillGemShockNova": "",
-            "Metadata/Items/Gems/SkillGemIceShot": "",
-            "Metadata/Items/Gems/SkillGemFreezingPulse": "",
-            "Metadata/Items/Gems/SkillGemGroundSlam": "",
-            "Metadata/Items/Gems/SkillGemBearTrap": "",
-            "Metadata/Items/Gems/SkillGemHeavyStrike": "",
-            "Metadata/Items/Gems/SkillGemCobraLash": "",
-            "Metadata/Items/Gems/SkillGemIceSpear": "",
-            "Metadata/Items/Gems/SkillGemArcaneCloak": "",
-            # =================================================================
-            # Support Gems
-            # =================================================================
-            "Metadata/Items/Gems/SupportGemMultistrike": "",
-            "Metadata/Items/Gems/SupportGemSpellCascade": "",
-            "Metadata/Items/Gems/SupportGemHandcastAnticipation": "",
-            "Metadata/Items/Gems/SupportGemMultiTotem": "",
-            "Metadata/Items/Gems/SupportGemAddedColdDamage": "",
-            "Metadata/Items/Gems/SupportGemAddedLightningDamage": "",
-            "Metadata/Items/Gems/SupportGemRage": "",
-            "Metadata/Items/Gems/SupportGemFasterAttack": "",
-            "Metadata/Items/Gems/SupportGemFasterCast": "",
-            "Metadata/Items/Gems/SupportGemRangedAttackTotem": "",
-            "Metadata/Items/Gems/SupportGemSpellTotem": "",
-            "Metadata/Items/Gems/SupportGemTrap": "",
-            "Metadata/Items/Gems/SupportGemTrapCooldown": "",
-            "Metadata/Items/Gems/SupportGemLesserMultipleProjectiles": "",
-            "Metadata/Items/Gems/SupportGemParallelProjectiles": "",
-            "Metadata/Items/Gems/SupportGemIncreasedAreaOfEffect": "",
-            "Metadata/Items/Gems/SupportGemBlind": "",
-            "Metadata/Items/Gems/SupportGemLifetap": "",
-            "Metadata/Items/Gems/SupportGemIncreasedDuration": "",
-            "Metadata/Items/Gems/SupportGemReducedDuration": "",
-            "Metadata/Items/Gems/SupportGemCastWhileChannelling": "",
-            "Metadata/Items/Gems/SupportGemImpendingDoom": "",
-            "Metadata/Items/Gems/SupportGemSpiritStrike": "",
-            "Metadata/Items/Gems/SupportGemArrowNova": "",
-            "Metadata/Items/Gems/SupportGemBlasphemy": "",
-            "Metadata/Items/Gems/SupportGemCastOnDeath": "",
-            "Metadata/Items/Gems/SupportGemFistOfWar": "",
-            "Metadata/Items/Gems/SupportGemFortify": "",
-            "Metadata/Items/Gems/SupportGemSecondWind": "",
-            "Metadata/Items/Gems/SupportGemMulticast": "",
-            "Metadata/Items/Gems/SupportGemSummonGhostOnKill": "",
-            "Metadata/Items/Gems/SupportGemFasterProjectiles": "",
-            "Metadata/Items/Gems/SupportGemPointBlank": "",
-            "Metadata/Items/Gems/SupportGemChanceToBleed": "",
-            "Metadata/Items/Gems/SupportGemKnockback": "",
-            "Metadata/Items/Gems/SupportGemMaim": "",
-            "Metadata/Items/Gems/SupportGemStun": "",
-            "Metadata/Items/Gems/SupportGemConcentratedEffect": "",
-            "Metadata/Items/Gems/SupportGemIncreasedCriticalStrikes": "",
-            "Metadata/Items/Gems/SupportGemMeleeSplash": "",
-            "Metadata/Items/Gems/SkillGemEnergyBlade": "",
-            "Metadata/Items/Gems/SkillGemChannelledSnipe": "",
-            # =================================================================
-            # Helmets
-            # =================================================================
-            "Metadata/Items/Armours/Helmets/HelmetStrInt4": "",  # Crusader Helmet
-            # =================================================================
-            # One Hand Axes
-            # =================================================================
-            "Metadata/Items/Weapons/OneHandWeapons/OneHandAxes/OneHandAxe22": "",  # Infernal Axe
             # =================================================================
             # One Hand Swords
             # =================================================================
@@ -720,44 +639,28 @@ class ItemsParser(SkillParserShared):
             # =================================================================
             # Boots
             # =================================================================
-            "Metadata/Items/Armours/Boots/BootsInt4": "",  # Scholar Boots
-            "Metadata/Items/Armours/Boots/BootsStrInt7": "",  # Legion Boots
             "Metadata/Items/Armours/Boots/BootsAtlas1": " (Cold and Lightning Resistance)",
             "Metadata/Items/Armours/Boots/BootsAtlas2": " (Fire and Cold Resistance)",
             "Metadata/Items/Armours/Boots/BootsAtlas3": " (Fire and Lightning Resistance)",
-            "Metadata/Items/Armours/Boots/BootsStrInt8": "",  # Crusader Boots
-            # =================================================================
-            # Gloves
-            # =================================================================
-            "Metadata/Items/Armours/Gloves/GlovesStrInt7": "",  # Legion Gloves
-            "Metadata/Items/Armours/Gloves/GlovesStrInt8": "",  # Crusader Gloves
             # =================================================================
             # Quivers
             # =================================================================
             # Serrated Arrow Quiver
-            "Metadata/Items/Quivers/QuiverNew1": "",
             "Metadata/Items/Quivers/Quiver6": " (legacy)",
             "Metadata/Items/Quivers/QuiverDescent": " (Descent)",
             # Two-Point Arrow Quiver
-            "Metadata/Items/Quivers/QuiverNew7": "",
             "Metadata/Items/Quivers/Quiver7": " (legacy)",
             # Sharktooth Arrow Quiver
-            "Metadata/Items/Quivers/QuiverNew3": "",
             "Metadata/Items/Quivers/Quiver8": " (legacy)",
             # Blunt Arrow Quiver
-            "Metadata/Items/Quivers/QuiverNew6": "",
             "Metadata/Items/Quivers/Quiver9": " (legacy)",
             # Fire Arrow Quiver
-            "Metadata/Items/Quivers/QuiverNew2": "",
             "Metadata/Items/Quivers/Quiver10": " (legacy)",
             # Broadhead Arrow Quiver
-            "Metadata/Items/Quivers/QuiverNew10": "",
             "Metadata/Items/Quivers/Quiver11": " (legacy)",
             # Penetrating Arrow Quiver
-            "Metadata/Items/Quivers/QuiverNew5": "",
             "Metadata/Items/Quivers/Quiver12": " (legacy)",
             # Spike-Point Arrow Quiver
-            "Metadata/Items/Quivers/QuiverNew8": "",
             "Metadata/Items/Quivers/Quiver13": " (legacy)",
             # =================================================================
             # Rings
@@ -793,10 +696,6 @@ class ItemsParser(SkillParserShared):
             "Metadata/Items/Amulets/Talismans/Talisman3_6_2": "  (Frenzy Charge on Kill)",
             "Metadata/Items/Amulets/Talismans/Talisman3_6_3": "  (Endurance Charge on Kill)",
             # =================================================================
-            # Currency items
-            # =================================================================
-            "Metadata/Items/Currency/CurrencyAncestralSilverCoin": "",
-            # =================================================================
             # Hideout decorations
             # =================================================================
             "Metadata/Items/Hideout/HideoutLightningCoil": " (hideout decoration)",
@@ -811,7 +710,6 @@ class ItemsParser(SkillParserShared):
             "Metadata/Items/Hideout/HideoutRitualTotem": " (hideout decoration)",
             "Metadata/Items/Hideout/HideoutCharredSkeleton": " (hideout decoration)",
             "Metadata/Items/Hideout/HideoutVaalWhispySmoke": " (hideout decoration)",
-            "Metadata/Items/Hideout/HideoutLionStatueKneeling": "",  # Sitting Lion Statue
             "Metadata/Items/Hideout/HideoutChurchRuins": " (hideout decoration)",
             "Metadata/Items/Hideout/HideoutIncaLetter": " (hideout decoration)",
             # =================================================================
@@ -824,44 +722,17 @@ class ItemsParser(SkillParserShared):
             # =================================================================
             # Item pieces
             # =================================================================
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_1": " (1 of 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_2": " (2 of 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_3": " (3 of 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_4": " (4 of 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueSword1_1": " (1 of 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueSword1_2": " (2 of 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueSword1_3": " (3 of 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueStaff1_1": " (1 of 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueStaff1_2": " (2 of 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueStaff1_3": " (3 of 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueBelt1_1": " (1 of 2)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueBelt1_2": " (2 of 2)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueQuiver1_1": " (1 of 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueQuiver1_2": " (2 of 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueQuiver1_3": " (3 of 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueHelmet1_1": " (1 of 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueHelmet1_2": " (2 of 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueHelmet1_3": " (3 of 3)",
+            **_part_appendixes("%s of %s", _UNIQUE_FRAGMENT_PARTS),
             # =================================================================
             # Cosmetic items
             # =================================================================
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x1": " (1x1)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x2": " (1x2)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x3": " (1x3)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x4": " (1x4)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x1": " (2x1)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x2": " (2x2)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x3": " (2x3)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x4": " (2x4)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox3x2": " (3x2)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox3x3": " (3x3)",
+            **_MYSTERY_BOX_APPENDIX_BY_ID,
             "Metadata/Items/MicrotransactionItemEffects/MicrotransactionIronMaiden": (
                 " (helmet skin)"
             ),
             "Metadata/Items/MicrotransactionItemEffects/MicrotransactionInfernalAxe": (
                 " (weapon skin)"
             ),
-            "Metadata/Items/MicrotransactionItemEffects/MicrotransactionColossusSword": "",
             "Metadata/Items/MicrotransactionItemEffects/MicrotransactionLegionBoots": (
                 " (boots skin)"
             ),
@@ -891,14 +762,7 @@ class ItemsParser(SkillParserShared):
             # =================================================================
             # Quest items
             # =================================================================
-            "Metadata/Items/QuestItems/GoldenPages/Page1": " (1 of 4)",
-            "Metadata/Items/QuestItems/GoldenPages/Page2": " (2 of 4)",
-            "Metadata/Items/QuestItems/GoldenPages/Page3": " (3 of 4)",
-            "Metadata/Items/QuestItems/GoldenPages/Page4": " (4 of 4)",
-            # =================================================================
-            # Heist equipment
-            # =================================================================
-            "Metadata/Items/Heist/HeistEquipmentCloak3": "",  # Hooded Cloak
+            **_part_appendixes("%s of %s", _GOLDEN_PAGE_PARTS),
             # =================================================================
             # Sanctified relics
             # =================================================================
@@ -912,24 +776,13 @@ class ItemsParser(SkillParserShared):
             # =================================================================
             "Metadata/Items/Gems/SkillGemPortal": " (камень умения)",
             # =================================================================
-            # One Hand Axes
-            # =================================================================
-            "Metadata/Items/Weapons/OneHandWeapons/OneHandAxes/OneHandAxe22": "",
-            # =================================================================
             # Boots
             # =================================================================
-            "Metadata/Items/Armours/Boots/BootsInt4": "",
             # Legion Boots
-            "Metadata/Items/Armours/Boots/BootsStrInt7": "",
             "Metadata/Items/Armours/Boots/BootsAtlas1": " (сопротивление холоду и молнии)",
             "Metadata/Items/Armours/Boots/BootsAtlas2": " (сопротивление огню и холоду)",
             "Metadata/Items/Armours/Boots/BootsAtlas3": " (сопротивление огню и молнии)",
             # =================================================================
-            # Gloves
-            # =================================================================
-            # Legion Gloves
-            "Metadata/Items/Armours/Gloves/GlovesStrInt7": "",
-            # =================================================================
             # Quivers
             # =================================================================
             "Metadata/Items/Quivers/QuiverDescent": " (Спуск)",
@@ -979,42 +832,14 @@ class ItemsParser(SkillParserShared):
             # =================================================================
             # Piece
             # =================================================================
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_1": " (1 из 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_2": " (2 из 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_3": " (3 из 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_4": " (4 из 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueSword1_1": " (1 из 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueSword1_2": " (2 из 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueSword1_3": " (3 из 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueStaff1_1": " (1 из 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueStaff1_2": " (2 из 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueStaff1_3": " (3 из 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueBelt1_1": " (1 из 2)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueBelt1_2": " (2 из 2)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueQuiver1_1": " (1 из 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueQuiver1_2": " (2 из 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueQuiver1_3": " (3 из 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueHelmet1_1": " (1 из 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueHelmet1_2": " (2 из 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueHelmet1_3": " (3 из 3)",
+            **_part_appendixes("%s из %s", _UNIQUE_FRAGMENT_PARTS),
             # =================================================================
             # MTX
             # =================================================================
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x1": " (1x1)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x2": " (1x2)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x3": " (1x3)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x4": " (1x4)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x1": " (2x1)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x2": " (2x2)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x3": " (2x3)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x4": " (2x4)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox3x2": " (3x2)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox3x3": " (3x3)",
-            "Metadata/Items/MicrotransactionItemEffects/MicrotransactionIronMaiden": "",
+            **_MYSTERY_BOX_APPENDIX_BY_ID,
             "Metadata/Items/MicrotransactionItemEffects/MicrotransactionInfernalAxe": (
                 " (внешний вид оружия)"
             ),
-            "Metadata/Items/MicrotransactionItemEffects/MicrotransactionColossusSword": "",
             "Metadata/Items/MicrotransactionItemEffects/MicrotransactionLegionBoots": (
                 " (микротранзакция)"
             ),
@@ -1030,76 +855,24 @@ class ItemsParser(SkillParserShared):
             # =================================================================
             # Quest items
             # =================================================================
-            "Metadata/Items/QuestItems/GoldenPages/Page1": " (1 из 4)",
-            "Metadata/Items/QuestItems/GoldenPages/Page2": " (2 из 4)",
-            "Metadata/Items/QuestItems/GoldenPages/Page3": " (3 из 4)",
-            "Metadata/Items/QuestItems/GoldenPages/Page4": " (4 из 4)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier8_1": " (1 из 2)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier8_2": " (2 из 2)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier9_1": " (1 из 3)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier9_2": " (2 из 3)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier9_3": " (3 из 3)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier10_1": " (1 из 3)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier10_2": " (2 из 3)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier10_3": " (3 из 3)",
+            **_part_appendixes("%s из %s", _GOLDEN_PAGE_PARTS),
+            **_part_appendixes("%s из %s", _MAP_UPGRADE_PARTS),
             "Metadata/Items/QuestItems/RibbonSpool": " (предмет)",
             "Metadata/Items/QuestItems/Act7/SilverLocket": " (предмет)",
             "Metadata/Items/QuestItems/Act7/KisharaStar": " (предмет)",
             "Metadata/Items/QuestItems/Act8/WingsOfVastiri": " (предмет)",
             "Metadata/Items/QuestItems/Act9/StormSword": " (предмет)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade1_1": " (1 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade1_2": " (2 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade1_3": " (3 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade1_4": " (4 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade1_5": " (5 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade1_6": " (6 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade1_7": " (7 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade1_8": " (8 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade2_1": " (1 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade2_2": " (2 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade2_3": " (3 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade2_4": " (4 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade2_5": " (5 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade2_6": " (6 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade2_7": " (7 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade2_8": " (8 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade3_1": " (1 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade3_2": " (2 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade3_3": " (3 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade3_4": " (4 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade3_5": " (5 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade3_6": " (6 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade3_7": " (7 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade3_8": " (8 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade4_1": " (1 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade4_2": " (2 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade4_3": " (3 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade4_4": " (4 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade4_5": " (5 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade4_6": " (6 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade4_7": " (7 из 8)",
-            "Metadata/Items/AtlasUpgrades/AtlasRegionUpgrade4_8": " (8 из 8)",
+            **_part_appendixes("%s из %s", _ATLAS_REGION_UPGRADE_PARTS),
         },
         "German": {
-            # =================================================================
-            # One Hand Axes
-            # =================================================================
-            "Metadata/Items/Weapons/OneHandWeapons/OneHandAxes/OneHandAxe22": "",
             # =================================================================
             # Boots
             # =================================================================
-            "Metadata/Items/Armours/Boots/BootsInt4": "",
             # Legion Boots
-            "Metadata/Items/Armours/Boots/BootsStrInt7": "",
             "Metadata/Items/Armours/Boots/BootsAtlas1": " (Kälte und Blitz Resistenzen)",
             "Metadata/Items/Armours/Boots/BootsAtlas2": " (Feuer und Kälte Resistenzen)",
             "Metadata/Items/Armours/Boots/BootsAtlas3": " (Feuer und Blitz Resistenzen)",
             # =================================================================
-            # Gloves
-            # =================================================================
-            # Legion Gloves
-            "Metadata/Items/Armours/Gloves/GlovesStrInt7": "",
-            # =================================================================
             # Quivers
             # =================================================================
             "Metadata/Items/Quivers/QuiverDescent": " (Descent)",
@@ -1140,42 +913,14 @@ class ItemsParser(SkillParserShared):
             # =================================================================
             # Piece
             # =================================================================
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_1": " (1 von 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_2": " (2 von 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_3": " (3 von 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueShield1_4": " (4 von 4)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueSword1_1": " (1 von 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueSword1_2": " (2 von 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueSword1_3": " (3 von 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueStaff1_1": " (1 von 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueStaff1_2": " (2 von 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueStaff1_3": " (3 von 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueBelt1_1": " (1 von 2)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueBelt1_2": " (2 von 2)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueQuiver1_1": " (1 von 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueQuiver1_2": " (2 von 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueQuiver1_3": " (3 von 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueHelmet1_1": " (1 von 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueHelmet1_2": " (2 von 3)",
-            "Metadata/Items/UniqueFragments/FragmentUniqueHelmet1_3": " (3 von 3)",
+            **_part_appendixes("%s von %s", _UNIQUE_FRAGMENT_PARTS),
             # =================================================================
             # MTX
             # =================================================================
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x1": " (1x1)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x2": " (1x2)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x3": " (1x3)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox1x4": " (1x4)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x1": " (2x1)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x2": " (2x2)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x3": " (2x3)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox2x4": " (2x4)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox3x2": " (3x2)",
-            "Metadata/Items/MicrotransactionCurrency/MysteryBox3x3": " (3x3)",
-            "Metadata/Items/MicrotransactionItemEffects/MicrotransactionIronMaiden": "",
+            **_MYSTERY_BOX_APPENDIX_BY_ID,
             "Metadata/Items/MicrotransactionItemEffects/MicrotransactionInfernalAxe": (
                 " (Weapon Skin)"
             ),
-            "Metadata/Items/MicrotransactionItemEffects/MicrotransactionColossusSword": "",
             "Metadata/Items/MicrotransactionItemEffects/MicrotransactionLegionBoots": (
                 " (Mikrotransaktion)"
             ),
@@ -1189,62 +934,339 @@ class ItemsParser(SkillParserShared):
             # =================================================================
             # Quest items
             # =================================================================
-            "Metadata/Items/QuestItems/GoldenPages/Page1": " (1 von 4)",
-            "Metadata/Items/QuestItems/GoldenPages/Page2": " (2 von 4)",
-            "Metadata/Items/QuestItems/GoldenPages/Page3": " (3 von 4)",
-            "Metadata/Items/QuestItems/GoldenPages/Page4": " (4 von 4)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier8_1": " (1 von 2)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier8_2": " (2 von 2)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier9_1": " (1 von 3)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier9_2": " (2 von 3)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier9_3": " (3 von 3)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier10_1": " (1 von 3)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier10_2": " (2 von 3)",
-            "Metadata/Items/QuestItems/MapUpgrades/MapUpgradeTier10_3": " (3 von 3)",
-            # =================================================================
+            **_part_appendixes("%s von %s", _GOLDEN_PAGE_PARTS),
+            **_part_appendixes("%s von %s", _MAP_UPGRADE_PARTS),
             # =================================================================
             # ==================== Germany only conflicts =====================
             # =================================================================
-            # =================================================================
             # Schleifstein
-            "Metadata/Items/Currency/CurrencyWeaponQuality": "",
             "Metadata/Items/HideoutInteractables/StrDexCraftingBench": " (Dinge fürs Versteck)",
         },
     }
 
-    _LANG = {
-        "English": {
-            "Low": "Low Tier",
-            "Mid": "Mid Tier",
-            "High": "High Tier",
-            "Uber": "Max Tier",
-            "decoration": "%s (%s %s decoration)",
-            "decoration_wounded": "%s (%s %s decoration, Wounded)",
-            "of": "%s of %s",
-            "descent": "Descent",
-        },
-        "German": {
-            "Low": "Niedrige Stufe",
-            "Mid": "Mittlere Stufe",
-            "High": "Hohe Stufe",
-            "Uber": "Maximale Stufe",
-            "decoration": "%s (%s %s Dekoration)",
-            "decoration_wounded": "%s (%s %s Dekoration, verletzt)",
-            "of": "%s von %s",
-            "descent": "Descent",
-        },
-        "Russian": {
-            "Low": "низкий уровень",
-            "Mid": "средний уровень",
-            "High": "высокий уровень",
-            "Uber": "максимальный уровень",
-            "decoration": "%s (%s %s предмет убежища)",
-            "decoration_wounded": "%s (%s %s предмет убежища, Раненый)",
-            "of": "%s из %s",
-            "descent": "Спуск",
-        },
+    # Conflicting names that are kept as they are; only the inventory icon is set
+    _NO_APPENDIX_BY_ID = {
+        "English": frozenset(
+            {
+                # =============================================================
+                # Skill Gems
+                # =============================================================
+                "Metadata/Items/Gems/SkillGemChargedAttack",
+                "Metadata/Items/Gems/SkillGemCyclone",
+                "Metadata/Items/Gems/SkillGemDualStrike",
+                "Metadata/Items/Gems/SkillGemLacerate",
+                "Metadata/Items/Gems/SkillGemBladestorm",
+                "Metadata/Items/Gems/SkillGemChainHook",
+                "Metadata/Items/Gems/SkillGemEarthquake",
+                "Metadata/Items/Gems/SkillGemMeleeTotem",
+                "Metadata/Items/Gems/SkillGemAncestralWarchief",
+                "Metadata/Items/Gems/SkillGemGeneralsCry",
+                "Metadata/Items/Gems/SkillGemLeapSlam",
+                "Metadata/Items/Gems/SkillGemShieldCharge",
+                "Metadata/Items/Gems/SkillGemChargedDash",
+                "Metadata/Items/Gems/SkillGemGlacialHammer",
+                "Metadata/Items/Gems/SkillGemIceCrash",
+                "Metadata/Items/Gems/SkillGemMoltenStrike",
+                "Metadata/Items/Gems/SkillGemSmite",
+                "Metadata/Items/Gems/SkillGemThrownShieldProjectile",
+                "Metadata/Items/Gems/SkillGemThrownWeapon",
+                "Metadata/Items/Gems/SkillGemVenomGyre",
+                "Metadata/Items/Gems/SkillGemWhirlingBlades",
+                "Metadata/Items/Gems/SkillGemPuncture",
+                "Metadata/Items/Gems/SkillGemRainOfArrows",
+                "Metadata/Items/Gems/SkillGemScourgeArrow",
+                "Metadata/Items/Gems/SkillGemToxicRain",
+                "Metadata/Items/Gems/SkillGemBlinkArrow",
+                "Metadata/Items/Gems/SkillGemEnsnaringArrow",
+                "Metadata/Items/Gems/SkillGemBlastRain",
+                "Metadata/Items/Gems/SkillGemElementalHit",
+                "Metadata/Items/Gems/SkillGemBladeBlast",
+                "Metadata/Items/Gems/SkillGemBladeVortex",
+                "Metadata/Items/Gems/SkillGemBladefall",
+                "Metadata/Items/Gems/SkillGemBloodreap",
+                "Metadata/Items/Gems/SkillGemVoidSphere",
+                "Metadata/Items/Gems/SkillGemDivineTempest",
+                "Metadata/Items/Gems/SkillGemFirestorm",
+                "Metadata/Items/Gems/SkillGemFrostBolt",
+                "Metadata/Items/Gems/SkillGemIceNova",
+                "Metadata/Items/Gems/SkillGemLightningTendrils",
+                "Metadata/Items/Gems/SkillGemSanctify",
+                "Metadata/Items/Gems/SkillGemMagmaOrb",
+                "Metadata/Items/Gems/SkillGemStormCall",
+                "Metadata/Items/Gems/SkillGemCorpseEruption",
+                "Metadata/Items/Gems/SkillGemFrostBomb",
+                "Metadata/Items/Gems/SkillGemHydrosphere",
+                "Metadata/Items/Gems/SkillGemPurge",
+                "Metadata/Items/Gems/SkillGemBlight",
+                "Metadata/Items/Gems/SkillGemEssenceDrain",
+                "Metadata/Items/Gems/SkillGemArcticBreath",
+                "Metadata/Items/Gems/SkillGemFrostBoltNova",
+                "Metadata/Items/Gems/SkillGemFlameTotem",
+                "Metadata/Items/Gems/SkillGemArtilleryBallista",
+                "Metadata/Items/Gems/SkillGemSiegeBallista",
+                "Metadata/Items/Gems/SkillGemFireTrap",
+                "Metadata/Items/Gems/SkillGemIceTrap",
+                "Metadata/Items/Gems/SkillGemLightningTrap",
+                "Metadata/Items/Gems/SkillGemIceSiphonTrap",
+                "Metadata/Items/Gems/SkillGemFlamethrowerTrap",
+                "Metadata/Items/Gems/SkillGemLightningTowerTrap",
+                "Metadata/Items/Gems/SkillGemPrecision",
+                "Metadata/Items/Gems/SkillGemVitality",
+                "Metadata/Items/Gems/SkillGemClarity",
+                "Metadata/Items/Gems/SkillGemBloodAndSand",
+                "Metadata/Items/Gems/SkillGemDash",
+                "Metadata/Items/Gems/SkillGemDesecrate",
+                "Metadata/Items/Gems/SkillGemPhaseRun",
+                "Metadata/Items/Gems/SkillGemPoachersMark",
+                "Metadata/Items/Gems/SkillGemCriticalWeakness",
+                "Metadata/Items/Gems/SkillGemWarlordsMark",
+                "Metadata/Items/Gems/SkillGemElementalWeakness",
+                "Metadata/Items/Gems/SkillGemNewVulnerability",
+                "Metadata/Items/Gems/SkillGemVulnerability",
+                "Metadata/Items/Gems/SkillGemEnduringCry",
+                "Metadata/Items/Gems/SkillGemRejuvenationTotem",
+                "Metadata/Items/Gems/SkillGemLightningWarp",
+                "Metadata/Items/Gems/SkillGemFlameDash",
+                "Metadata/Items/Gems/SkillGemFrostblink",
+                "Metadata/Items/Gems/SkillGemSmokeMine",
+                "Metadata/Items/Gems/SkillGemSearingBond",
+                "Metadata/Items/Gems/SkillGemShockwaveTotem",
+                "Metadata/Items/Gems/SkillGemBurningArrow",
+                "Metadata/Items/Gems/SkillGemPoisonArrow",
+                "Metadata/Items/Gems/SkillGemShrapnelShot",
+                "Metadata/Items/Gems/SkillGemSummonSkeletons",
+                "Metadata/Items/Gems/SkillGemSummonRagingSpirit",
+                "Metadata/Items/Gems/SkillGemDetonateDead",
+                "Metadata/Items/Gems/SkillGemEtherealKnives",
+                "Metadata/Items/Gems/SkillGemBoneLance",
+                "Metadata/Items/Gems/SkillGemBallLightning",
+                "Metadata/Items/Gems/SkillGemBlazingSalvo",
+                "Metadata/Items/Gems/SkillGemColdSnap",
+                "Metadata/Items/Gems/SkillGemDarkPact",
+                "Metadata/Items/Gems/SkillGemFireball",
+                "Metadata/Items/Gems/SkillGemGlacialCascade",
+                "Metadata/Items/Gems/SkillGemFrostBlades",
+                "Metadata/Items/Gems/SkillGemShatteringSteel",
+                "Metadata/Items/Gems/SkillGemWildStrike",
+                "Metadata/Items/Gems/SkillGemCleave",
+                "Metadata/Items/Gems/SkillGemDominatingBlow",
+                "Metadata/Items/Gems/SkillGemInfernalBlow",
+                "Metadata/Items/Gems/SkillGemSunder",
+                "Metadata/Items/Gems/SkillGemLightningArrow",
+                "Metadata/Items/Gems/SkillGemExplosiveArrow",
+                "Metadata/Items/Gems/SkillGemViperStrike",
+                "Metadata/Items/Gems/SkillGemSweep",
+                "Metadata/Items/Gems/SkillGemIncinerate",
+                "Metadata/Items/Gems/SkillGemShockNova",
+                "Metadata/Items/Gems/SkillGemIceShot",
+                "Metadata/Items/Gems/SkillGemFreezingPulse",
+                "Metadata/Items/Gems/SkillGemGroundSlam",
+                "Metadata/Items/Gems/SkillGemBearTrap",
+                "Metadata/Items/Gems/SkillGemHeavyStrike",
+                "Metadata/Items/Gems/SkillGemCobraLash",
+                "Metadata/Items/Gems/SkillGemIceSpear",
+                "Metadata/Items/Gems/SkillGemArcaneCloak",
+                # =============================================================
+                # Support Gems
+                # =============================================================
+                "Metadata/Items/Gems/SupportGemMultistrike",
+                "Metadata/Items/Gems/SupportGemSpellCascade",
+                "Metadata/Items/Gems/SupportGemHandcastAnticipation",
+                "Metadata/Items/Gems/SupportGemMultiTotem",
+                "Metadata/Items/Gems/SupportGemAddedColdDamage",
+                "Metadata/Items/Gems/SupportGemAddedLightningDamage",
+                "Metadata/Items/Gems/SupportGemRage",
+                "Metadata/Items/Gems/SupportGemFasterAttack",
+                "Metadata/Items/Gems/SupportGemFasterCast",
+                "Metadata/Items/Gems/SupportGemRangedAttackTotem",
+                "Metadata/Items/Gems/SupportGemSpellTotem",
+                "Metadata/Items/Gems/SupportGemTrap",
+                "Metadata/Items/Gems/SupportGemTrapCooldown",
+                "Metadata/Items/Gems/SupportGemLesserMultipleProjectiles",
+                "Metadata/Items/Gems/SupportGemParallelProjectiles",
+                "Metadata/Items/Gems/SupportGemIncreasedAreaOfEffect",
+                "Metadata/Items/Gems/SupportGemBlind",
+                "Metadata/Items/Gems/SupportGemLifetap",
+                "Metadata/Items/Gems/SupportGemIncreasedDuration",
+                "Metadata/Items/Gems/SupportGemReducedDuration",
+                "Metadata/Items/Gems/SupportGemCastWhileChannelling",
+                "Metadata/Items/Gems/SupportGemImpendingDoom",
+                "Metadata/Items/Gems/SupportGemSpiritStrike",
+                "Metadata/Items/Gems/SupportGemArrowNova",
+                "Metadata/Items/Gems/SupportGemBlasphemy",
+                "Metadata/Items/Gems/SupportGemCastOnDeath",
+                "Metadata/Items/Gems/SupportGemFistOfWar",
+                "Metadata/Items/Gems/SupportGemFortify",
+                "Metadata/Items/Gems/SupportGemSecondWind",
+                "Metadata/Items/Gems/SupportGemMulticast",
+                "Metadata/Items/Gems/SupportGemSummonGhostOnKill",
+                "Metadata/Items/Gems/SupportGemFasterProjectiles",
+                "Metadata/Items/Gems/SupportGemPointBlank",
+                "Metadata/Items/Gems/SupportGemChanceToBleed",
+                "Metadata/Items/Gems/SupportGemKnockback",
+                "Metadata/Items/Gems/SupportGemMaim",
+                "Metadata/Items/Gems/SupportGemStun",
+                "Metadata/Items/Gems/SupportGemConcentratedEffect",
+                "Metadata/Items/Gems/SupportGemIncreasedCriticalStrikes",
+                "Metadata/Items/Gems/SupportGemMeleeSplash",
+                "Metadata/Items/Gems/SkillGemEnergyBlade",
+                "Metadata/Items/Gems/SkillGemChannelledSnipe",
+                # =============================================================
+                # Helmets
+                # =============================================================
+                "Metadata/Items/Armours/Helmets/HelmetStrInt4",  # Crusader Helmet
+                # =============================================================
+                # One Hand Axes
+                # =============================================================
+                "Metadata/Items/Weapons/OneHandWeapons/OneHandAxes/OneHandAxe22",  # Infernal Axe
+                # =============================================================
+                # Boots
+                # =============================================================
+                "Metadata/Items/Armours/Boots/BootsInt4",  # Scholar Boots
+                "Metadata/Items/Armours/Boots/BootsStrInt7",  # Legion Boots
+                "Metadata/Items/Armours/Boots/BootsStrInt8",  # Crusader Boots
+                # =============================================================
+                # Gloves
+                # =============================================================
+                "Metadata/Items/Armours/Gloves/GlovesStrInt7",  # Legion Gloves
+                "Metadata/Items/Armours/Gloves/GlovesStrInt8",  # Crusader Gloves
+                # =============================================================
+                # Quivers
+                # =============================================================
+                # Serrated Arrow Quiver
+                "Metadata/Items/Quivers/QuiverNew1",
+                # Two-Point Arrow Quiver
+                "Metadata/Items/Quivers/QuiverNew7",
+                # Sharktooth Arrow Quiver
+                "Metadata/Items/Quivers/QuiverNew3",
+                # Blunt Arrow Quiver
+                "Metadata/Items/Quivers/QuiverNew6",
+                # Fire Arrow Quiver
+                "Metadata/Items/Quivers/QuiverNew2",
+                # Broadhead Arrow Quiver
+                "Metadata/Items/Quivers/QuiverNew10",
+                # Penetrating Arrow Quiver
+                "Metadata/Items/Quivers/QuiverNew5",
+                # Spike-Point Arrow Quiver
+                "Metadata/Items/Quivers/QuiverNew8",
+                # =============================================================
+                # Currency items
+                # =============================================================
+                "Metadata/Items/Currency/CurrencyAncestralSilverCoin",
+                # =============================================================
+                # Hideout decorations
+                # =============================================================
+                "Metadata/Items/Hideout/HideoutLionStatueKneeling",  # Sitting Lion Statue
+                # =============================================================
+                # Cosmetic items
+                # =============================================================
+                "Metadata/Items/MicrotransactionItemEffects/MicrotransactionColossusSword",
+                # =============================================================
+                # Heist equipment
+                # =============================================================
+                "Metadata/Items/Heist/HeistEquipmentCloak3",  # Hooded Cloak
+            }
+        ),
+        "Russian": frozenset(
+            {
+                # =============================================================
+                # One Hand Axes
+                # =============================================================
+                "Metadata/Items/Weapons/OneHandWeapons/OneHandAxes/OneHandAxe22",
+                # =============================================================
+                # Boots
+                # =============================================================
+                "Metadata/Items/Armours/Boots/BootsInt4",
+                # Legion Boots
+                "Metadata/Items/Armours/Boots/BootsStrInt7",
+                # =============================================================
+                # Gloves
+                # =============================================================
+                # Legion Gloves
+                "Metadata/Items/Armours/Gloves/GlovesStrInt7",
+                # =============================================================
+                # MTX
+                # =============================================================
+                "Metadata/Items/MicrotransactionItemEffects/MicrotransactionIronMaiden",
+                "Metadata/Items/MicrotransactionItemEffects/MicrotransactionColossusSword",
+            }
+        ),
+        "German": frozenset(
+            {
+                # =============================================================
+                # One Hand Axes
+                # =============================================================
+                "Metadata/Items/Weapons/OneHandWeapons/OneHandAxes/OneHandAxe22",
+                # =============================================================
+                # Boots
+                # =============================================================
+                "Metadata/Items/Armours/Boots/BootsInt4",
+                # Legion Boots
+                "Metadata/Items/Armours/Boots/BootsStrInt7",
+                # =============================================================
+                # Gloves
+                # =============================================================
+                # Legion Gloves
+                "Metadata/Items/Armours/Gloves/GlovesStrInt7",
+                # =============================================================
+                # MTX
+                # =============================================================
+                "Metadata/Items/MicrotransactionItemEffects/MicrotransactionIronMaiden",
+                "Metadata/Items/MicrotransactionItemEffects/MicrotransactionColossusSword",
+                # =============================================================
+                # ==================== Germany only conflicts =====================
+                # =============================================================
+                # Schleifstein
+                "Metadata/Items/Currency/CurrencyWeaponQuality",
+            }
+        ),
     }
 
+    _NAME_DECORATION_BY_ID = _name_decoration_map(
+        _NAME_OVERRIDE_BY_ID, _NAME_APPENDIX_BY_ID, _NO_APPENDIX_BY_ID
+    )
+
+    _LANG = MappingProxyType(
+        {
+            "English": MappingProxyType(
+                {
+                    "Low": "Low Tier",
+                    "Mid": "Mid Tier",
+                    "High": "High Tier",
+                    "Uber": "Max Tier",
+                    "decoration": "%s (%s %s decoration)",
+                    "decoration_wounded": "%s (%s %s decoration, Wounded)",
+                    "of": "%s of %s",
+                    "descent": "Descent",
+                }
+            ),
+            "German": MappingProxyType(
+                {
+                    "Low": "Niedrige Stufe",
+                    "Mid": "Mittlere Stufe",
+                    "High": "Hohe Stufe",
+                    "Uber": "Maximale Stufe",
+                    "decoration": "%s (%s %s Dekoration)",
+                    "decoration_wounded": "%s (%s %s Dekoration, verletzt)",
+                    "of": "%s von %s",
+                    "descent": "Descent",
+                }
+            ),
+            "Russian": MappingProxyType(
+                {
+                    "Low": "низкий уровень",
+                    "Mid": "средний уровень",
+                    "High": "высокий уровень",
+                    "Uber": "максимальный уровень",
+                    "decoration": "%s (%s %s предмет убежища)",
+                    "decoration_wounded": "%s (%s %s предмет убежища, Раненый)",
+                    "of": "%s из %s",
+                    "descent": "Спуск",
+                }
+            ),
+        }
+    )
+
     # Unreleased or disabled items to avoid exporting to the wiki
     _SKIP_ITEMS_BY_ID = {
         # =================================================================
@@ -1684,10 +1706,8 @@ class ItemsParser(SkillParserShared):
         "Metadata/Items/MicrotransactionCharacterEffects/MicrotransactionJingweiCharacterEffect",
         "Metadata/Items/MicrotransactionItemEffects/MicrotransactionJingweiFootprintsEffect",
         "Metadata/Items/MicrotransactionCharacterEffects/MicrotransactionJingweiPortraitFrame",
-        (
-            "Metadata/Items/MicrotransactionSkillEffects/MicrotransactionHasinaWhirlingBladesEffect"
-            "Metadata/Items/MicrotransactionSkillEffects/MicrotransactionHasinaBladeVortexEffect"
-        ),
+        "Metadata/Items/MicrotransactionSkillEffects/MicrotransactionHasinaWhirlingBladesEffect",
+        "Metadata/Items/MicrotransactionSkillEffects/MicrotransactionHasinaBladeVortexEffect",
         "Metadata/Items/MicrotransactionItemEffects/MicrotransactionAuspiciousDragonWeaponEffect1",
         "Metadata/Items/MicrotransactionItemEffects/MicrotransactionAuspiciousDragonWeaponEffect2",
         "Metadata/Items/MicrotransactionItemEffects/MicrotransactionAuspiciousDragonWeaponEffect3",
@@ -2559,6 +2579,7 @@ class ItemsParser(SkillParserShared):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._parsed_args = None
+        self._base_ot_cache = {}
         self._language = config.get_option("language")
         if self._language != "English":
             self.rr2 = RelationalReader(
@@ -2574,10 +2595,15 @@ class ItemsParser(SkillParserShared):
         else:
             self.rr2 = None
 
-    def _skip_quest_contracts(self, infobox: OrderedDict, base_item_type):
+    @cached_property
+    def _lang(self):
+        # Language strings for the configured language; fixed for the lifetime of the parser
+        return self._LANG[self._language]
+
+    def _skip_quest_contracts(self, infobox: dict, base_item_type):
         return base_item_type.rowid not in self.rr["HeistContracts.dat64"].index["BaseItemTypesKey"]
 
-    def _tattoo(self, infobox: OrderedDict, base_item_type):
+    def _tattoo(self, infobox: dict, base_item_type):
         if "BaseItemTypesKey" not in self.rr["PassiveSkillTattoos.dat64"].index:
             self.rr["PassiveSkillTattoos.dat64"].build_index("BaseItemTypesKey")
         data = next(
@@ -2645,7 +2671,7 @@ class ItemsParser(SkillParserShared):
             return False
         return True
 
-    def _skill_gem(self, infobox: OrderedDict, base_item_type):
+    def _skill_gem(self, infobox: dict, base_item_type):
         try:
             skill_gem = self.rr["SkillGems.dat64"].index["BaseItemTypesKey"][base_item_type.rowid]
         except KeyError:
@@ -3207,28 +3233,25 @@ class ItemsParser(SkillParserShared):
     # This is a hack and should be done better.
     # TODO: properly parse map series
 
-    def MapSeriesHelper(d):
-        map_series = [
-            "Original",
-            "The Awakening",
-            "Atlas of Worlds",
-            "War for the Atlas",
-            "Betrayal",
-            "Synthesis",
-            "Legion",
-            "Blight",
-            "Metamorph",
-            "Delirium",
-            "Harvest",
-            "Heist",
-            "Ritual",
-            "Ultimatum",
-            "Expedition",
-            "Scourge",
-            "Archnemesis",
-        ]
-        # print('yep', map_series[d])
-        return map_series[d]
+    _MAP_SERIES = (
+        "Original",
+        "The Awakening",
+        "Atlas of Worlds",
+        "War for the Atlas",
+        "Betrayal",
+        "Synthesis",
+        "Legion",
+        "Blight",
+        "Metamorph",
+        "Delirium",
+        "Harvest",
+        "Heist",
+        "Ritual",
+        "Ultimatum",
+        "Expedition",
+        "Scourge",
+        "Archnemesis",
+    )
 
     _type_map = _type_factory(
         data_file="Maps.dat64",
@@ -3276,7 +3299,7 @@ class ItemsParser(SkillParserShared):
                     "condition": lambda v: v is not None,
                 },
             ),
-            ("MapSeriesKey", {"template": "map_series", "format": MapSeriesHelper}),
+            ("MapSeriesKey", {"template": "map_series", "format": _MAP_SERIES.__getitem__}),
         ),
         row_index=True,
         function=_maps_extra,
@@ -3284,12 +3307,17 @@ class ItemsParser(SkillParserShared):
 
     def _map_fragment_extra(self, infobox, base_item_type, map_fragment_mods):
         if map_fragment_mods["ModsKeys"]:
-            i = 1
-            while infobox.get("implicit%s" % i) is not None:
-                i += 1
-            for mod in map_fragment_mods["ModsKeys"]:
-                infobox["implicit%s" % i] = mod["Id"]
-                i += 1
+            # Start at the first implicit slot not already filled from BaseItemTypes.dat
+            used = {
+                int(k[8:])
+                for k in infobox
+                if k.startswith("implicit") and k[8:].isdigit() and infobox[k] is not None
+            }
+            start = 1
+            while start in used:
+                start += 1
+            for i, mod in enumerate(map_fragment_mods["ModsKeys"], start=start):
+                infobox[f"implicit{i}"] = mod["Id"]
 
     _type_map_fragment_mods = _type_factory(
         data_file="MapFragmentMods.dat64",
@@ -3299,46 +3327,79 @@ class ItemsParser(SkillParserShared):
         fail_condition=True,
     )
 
+    # (category, category column, ((row, row column), ...))
+    _ESSENCE_CATEGORIES = (
+        (
+            None,
+            None,
+            (
+                ("OneHandWeapon", "Display_OneHandWeapon_ModsKey"),
+                ("TwoHandWeapon", "Display_TwoHandWeapon_ModsKey"),
+            ),
+        ),
+        (
+            "MeleeWeapon",
+            "Display_MeleeWeapon_ModsKey",
+            (),
+        ),
+        (
+            "RangedWeapon",
+            "Display_RangedWeapon_ModsKey",
+            (
+                ("Wand", "Display_Wand_ModsKey"),
+                ("Bow", "Display_Bow_ModsKey"),
+            ),
+        ),
+        (
+            "Weapon",
+            "Display_Weapon_ModsKey",
+            (("TwoHandMeleeWeapon", "Display_TwoHandMeleeWeapon_ModsKey"),),
+        ),
+        (
+            "Armour",
+            "Display_Armour_ModsKey",
+            (
+                ("Gloves", "Display_Gloves_ModsKey"),
+                ("Boots", "Display_Boots_ModsKey"),
+                ("BodyArmour", "Display_BodyArmour_ModsKey"),
+                ("Helmet", "Display_Helmet_ModsKey"),
+                ("Shield", "Display_Shield_ModsKey"),
+            ),
+        ),
+        (
+            "Quiver",
+            "Display_Quiver_ModsKey",
+            (),
+        ),
+        (
+            "Jewellery",
+            "Display_Jewellery_ModsKey",
+            (
+                ("Amulet", "Display_Amulet_ModsKey"),
+                ("Ring", "Display_Ring_ModsKey"),
+                ("Belt", "Display_Belt_ModsKey"),
+            ),
+        ),
+    )
+
     def _essence_extra(self, infobox, base_item_type, essence):
         infobox["is_essence"] = True
 
         #
         # Essence description
         #
-        def get_str(k):
-            return self.rr["ClientStrings.dat64"].index["Id"]["EssenceCategory%s" % k]["Text"]
+        client_strings = self.rr["ClientStrings.dat64"].index["Id"]
 
-        essence_categories = OrderedDict(
-            (
-                (
-                    None,
-                    ("OneHandWeapon", "TwoHandWeapon"),
-                ),
-                (
-                    "MeleeWeapon",
-                    (),
-                ),
-                (
-                    "RangedWeapon",
-                    ("Wand", "Bow"),
-                ),
-                (
-                    "Weapon",
-                    ("TwoHandMeleeWeapon",),
-                ),
-                ("Armour", ("Gloves", "Boots", "BodyArmour", "Helmet", "Shield")),
-                ("Quiver", ()),
-                ("Jewellery", ("Amulet", "Ring", "Belt")),
-            )
-        )
+        def get_str(k):
+            return client_strings["EssenceCategory" + k]["Text"]
 
         out = []
 
         if essence["ItemLevelRestriction"] != 0:
             out.append(
-                self.rr["ClientStrings.dat64"]
-                .index["Id"]["EssenceModLevelRestriction"]["Text"]
-                .replace("{0}", str(essence["ItemLevelRestriction"]))
+                client_strings["EssenceModLevelRestriction"]["Text"].replace(
+                    "{0}", str(essence["ItemLevelRestriction"])
+                )
             )
             out[-1] += "<br />"
 
@@ -3348,15 +3409,15 @@ class ItemsParser(SkillParserShared):
 
         item_mod = essence["Display_Items_ModsKey"]
 
-        for category, rows in essence_categories.items():
-            if category is None:
+        for category, category_column, rows in self._ESSENCE_CATEGORIES:
+            if category_column is None:
                 category_mod = None
             else:
-                category_mod = essence["Display_%s_ModsKey" % category]
+                category_mod = essence[category_column]
 
             cur = len(out)
-            for row_key in rows:
-                mod = essence["Display_%s_ModsKey" % row_key]
+            for row_key, row_column in rows:
+                mod = essence[row_column]
                 if mod is None:
                     continue
                 if mod == category_mod:
@@ -3428,7 +3489,7 @@ class ItemsParser(SkillParserShared):
                 "Monster_ModsKeys",
                 {
                     "template": "essence_monster_modifier_ids",
-                    "format": lambda v: ", ".join([m["Id"] for m in v]),
+                    "format": lambda v: ", ".join(map(_get_id, v)),
                     "condition": lambda v: v,
                 },
             ),
@@ -3482,81 +3543,78 @@ class ItemsParser(SkillParserShared):
         row_index=True,
     )
 
-    def _harvest_seed_extra(self, infobox, base_item_type, harvest_object):
-        if not self.rr["HarvestSeedTypes.dat64"].index.get("HarvestObjectsKey"):
-            self.rr["HarvestSeedTypes.dat64"].build_index("HarvestObjectsKey")
+    _HARVEST_SEED_COLUMN_MAP = _compile_column_map(
+        (
+            (
+                "Text",
+                {
+                    "template": "seed_effect",
+                },
+            ),
+            (
+                "Tier",
+                {
+                    "template": "seed_tier",
+                },
+            ),
+            (
+                "GrowthCycles",
+                {
+                    "template": "seed_growth_cycles",
+                },
+            ),
+            (
+                "RequiredNearbySeed_Tier",
+                {
+                    "template": "seed_required_nearby_seed_tier",
+                    "condition": lambda v: v > 0,
+                },
+            ),
+            (
+                "RequiredNearbySeed_Amount",
+                {
+                    "template": "seed_required_nearby_seed_amount",
+                    "condition": lambda v: v > 0,
+                },
+            ),
+            (
+                "WildLifeforceConsumedPercentage",
+                {
+                    "template": "seed_consumed_wild_lifeforce_percentage",
+                    "condition": lambda v: v > 0,
+                },
+            ),
+            (
+                "VividLifeforceConsumedPercentage",
+                {
+                    "template": "seed_consumed_vivid_lifeforce_percentage",
+                    "condition": lambda v: v > 0,
+                },
+            ),
+            (
+                "PrimalLifeforceConsumedPercentage",
+                {
+                    "template": "seed_consumed_primal_lifeforce_percentage",
+                    "condition": lambda v: v > 0,
+                },
+            ),
+            (
+                "HarvestCraftOptionsKeys",
+                {
+                    "template": "seed_granted_craft_option_ids",
+                    "format": lambda v: ",".join(map(_get_id, v)),
+                    "condition": lambda v: v,
+                },
+            ),
+        )
+    )
 
+    def _harvest_seed_extra(self, infobox, base_item_type, harvest_object):
         harvest_seed = self.rr["HarvestSeedTypes.dat64"].index["HarvestObjectsKey"][
             harvest_object.rowid
         ]
 
-        _apply_column_map(
-            infobox,
-            (
-                (
-                    "Text",
-                    {
-                        "template": "seed_effect",
-                    },
-                ),
-                (
-                    "Tier",
-                    {
-                        "template": "seed_tier",
-                    },
-                ),
-                (
-                    "GrowthCycles",
-                    {
-                        "template": "seed_growth_cycles",
-                    },
-                ),
-                (
-                    "RequiredNearbySeed_Tier",
-                    {
-                        "template": "seed_required_nearby_seed_tier",
-                        "condition": lambda v: v > 0,
-                    },
-                ),
-                (
-                    "RequiredNearbySeed_Amount",
-                    {
-                        "template": "seed_required_nearby_seed_amount",
-                        "condition": lambda v: v > 0,
-                    },
-                ),
-                (
-                    "WildLifeforceConsumedPercentage",
-                    {
-                        "template": "seed_consumed_wild_lifeforce_percentage",
-                        "condition": lambda v: v > 0,
-                    },
-                ),
-                (
-                    "VividLifeforceConsumedPercentage",
-                    {
-                        "template": "seed_consumed_vivid_lifeforce_percentage",
-                        "condition": lambda v: v > 0,
-                    },
-                ),
-                (
-                    "PrimalLifeforceConsumedPercentage",
-                    {
-                        "template": "seed_consumed_primal_lifeforce_percentage",
-                        "condition": lambda v: v > 0,
-                    },
-                ),
-                (
-                    "HarvestCraftOptionsKeys",
-                    {
-                        "template": "seed_granted_craft_option_ids",
-                        "format": lambda v: ",".join([k["Id"] for k in v]),
-                        "condition": lambda v: v,
-                    },
-                ),
-            ),
-            harvest_seed,
-        )
+        _apply_column_map(infobox, self._HARVEST_SEED_COLUMN_MAP, harvest_seed)
 
         return True
 
@@ -3576,47 +3634,44 @@ class ItemsParser(SkillParserShared):
         row_index=True,
     )
 
-    def _harvest_plant_booster_extra(self, infobox, base_item_type, harvest_object):
-        if not self.rr["HarvestSeedTypes.dat64"].index.get("HarvestObjectsKey"):
-            self.rr["HarvestSeedTypes.dat64"].build_index("HarvestObjectsKey")
+    _HARVEST_PLANT_BOOSTER_COLUMN_MAP = _compile_column_map(
+        (
+            (
+                "Radius",
+                {
+                    "template": "plant_booster_radius",
+                },
+            ),
+            (
+                "Lifeforce",
+                {
+                    "template": "plant_booster_lifeforce",
+                    "condition": lambda v: v > 0,
+                },
+            ),
+            (
+                "AdditionalCraftingOptionsChance",
+                {
+                    "template": "plant_booster_additional_crafting_options",
+                    "condition": lambda v: v > 0,
+                },
+            ),
+            (
+                "RareExtraChances",
+                {
+                    "template": "plant_booster_extra_chances",
+                    "condition": lambda v: v > 0,
+                },
+            ),
+        )
+    )
 
+    def _harvest_plant_booster_extra(self, infobox, base_item_type, harvest_object):
         harvest_plant_booster = self.rr["HarvestPlantBoosters.dat64"].index["HarvestObjectsKey"][
             harvest_object.rowid
         ]
 
-        _apply_column_map(
-            infobox,
-            (
-                (
-                    "Radius",
-                    {
-                        "template": "plant_booster_radius",
-                    },
-                ),
-                (
-                    "Lifeforce",
-                    {
-                        "template": "plant_booster_lifeforce",
-                        "condition": lambda v: v > 0,
-                    },
-                ),
-                (
-                    "AdditionalCraftingOptionsChance",
-                    {
-                        "template": "plant_booster_additional_crafting_options",
-                        "condition": lambda v: v > 0,
-                    },
-                ),
-                (
-                    "RareExtraChances",
-                    {
-                        "template": "plant_booster_extra_chances",
-                        "condition": lambda v: v > 0,
-                    },
-                ),
-            ),
-            harvest_plant_booster,
-        )
+        _apply_column_map(infobox, self._HARVEST_PLANT_BOOSTER_COLUMN_MAP, harvest_plant_booster)
 
         return True
 
@@ -3664,161 +3719,160 @@ class ItemsParser(SkillParserShared):
         row_index=True,
     )
 
-    _cls_map = dict()
-    """
-    This defines the expected data elements for an item class.
-    """
-    _cls_map = {
-        # Jewellery
-        "Amulet": (_type_amulet,),
-        # Armour types
-        "Armour": (
-            _type_level,
-            _type_attribute,
-            _type_armour,
-        ),
-        "Gloves": (
-            _type_level,
-            _type_attribute,
-            _type_armour,
-        ),
-        "Boots": (
-            _type_level,
-            _type_attribute,
-            _type_armour,
-        ),
-        "Body Armour": (
-            _type_level,
-            _type_attribute,
-            _type_armour,
-        ),
-        "Helmet": (
-            _type_level,
-            _type_attribute,
-            _type_armour,
-        ),
-        "Shield": (_type_level, _type_attribute, _type_armour, _type_shield),
-        # Weapons
-        "Claw": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "Dagger": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "Rune Dagger": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "Wand": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "One Hand Sword": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "Thrusting One Hand Sword": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "One Hand Axe": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "One Hand Mace": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "Sceptre": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "Bow": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "Staff": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "Two Hand Sword": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "Two Hand Axe": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "Two Hand Mace": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "Warstaff": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        "FishingRod": (
-            _type_level,
-            _type_attribute,
-            _type_weapon,
-        ),
-        # Flasks
-        "LifeFlask": (_type_level, _type_flask, _type_flask_charges),
-        "ManaFlask": (_type_level, _type_flask, _type_flask_charges),
-        "HybridFlask": (_type_level, _type_flask, _type_flask_charges),
-        "UtilityFlask": (_type_level, _type_flask, _type_flask_charges),
-        "UtilityFlaskCritical": (_type_level, _type_flask, _type_flask_charges),
-        # Gems
-        "Active Skill Gem": (_skill_gem,),
-        "Support Skill Gem": (_skill_gem,),
-        # Currency-like items
-        "Currency": (_type_currency,),
-        "StackableCurrency": (_type_currency, _type_essence, _type_blight_item, _tattoo),
-        "DelveSocketableCurrency": (_type_currency,),
-        "DelveStackableSocketableCurrency": (_type_currency,),
-        "HideoutDoodad": (_type_currency, _type_hideout_doodad),
-        "Microtransaction": (_type_currency, _type_microtransaction),
-        "DivinationCard": (_type_currency,),
-        "IncubatorStackable": (_type_currency,),
-        "HarvestSeed": (_type_currency, _type_harvest_seed),
-        "HarvestPlantBooster": (_type_currency, _type_harvest_plant_booster),
-        # Labyrinth stuff
-        # 'LabyrinthItem': (),
-        "LabyrinthTrinket": (_type_labyrinth_trinket,),
-        # 'LabyrinthMapItem': (),
-        # Misc
-        "Map": (_type_map,),
-        "MapFragment": (_type_map_fragment_mods,),
-        "QuestItem": (_skip_quest_contracts,),
-        "AtlasRegionUpgradeItem": (),
-        "MetamorphosisDNA": (),
-        # heist league
-        "HeistContract": (_type_heist_contract,),
-        "HeistEquipmentWeapon": (_type_heist_equipment,),
-        "HeistEquipmentTool": (_type_heist_equipment,),
-        "HeistEquipmentUtility": (_type_heist_equipment,),
-        "HeistEquipmentReward": (_type_heist_equipment,),
-        "HeistBlueprint": (),
-        "Trinket": (),
-        "HeistObjective": (),
-    }
+    # This defines the expected data elements for an item class.
+    _cls_map = MappingProxyType(
+        {
+            # Jewellery
+            "Amulet": (_type_amulet,),
+            # Armour types
+            "Armour": (
+                _type_level,
+                _type_attribute,
+                _type_armour,
+            ),
+            "Gloves": (
+                _type_level,
+                _type_attribute,
+                _type_armour,
+            ),
+            "Boots": (
+                _type_level,
+                _type_attribute,
+                _type_armour,
+            ),
+            "Body Armour": (
+                _type_level,
+                _type_attribute,
+                _type_armour,
+            ),
+            "Helmet": (
+                _type_level,
+                _type_attribute,
+                _type_armour,
+            ),
+            "Shield": (_type_level, _type_attribute, _type_armour, _type_shield),
+            # Weapons
+            "Claw": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "Dagger": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "Rune Dagger": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "Wand": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "One Hand Sword": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "Thrusting One Hand Sword": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "One Hand Axe": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "One Hand Mace": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "Sceptre": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "Bow": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "Staff": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "Two Hand Sword": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "Two Hand Axe": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "Two Hand Mace": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "Warstaff": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            "FishingRod": (
+                _type_level,
+                _type_attribute,
+                _type_weapon,
+            ),
+            # Flasks
+            "LifeFlask": (_type_level, _type_flask, _type_flask_charges),
+            "ManaFlask": (_type_level, _type_flask, _type_flask_charges),
+            "HybridFlask": (_type_level, _type_flask, _type_flask_charges),
+            "UtilityFlask": (_type_level, _type_flask, _type_flask_charges),
+            "UtilityFlaskCritical": (_type_level, _type_flask, _type_flask_charges),
+            # Gems
+            "Active Skill Gem": (_skill_gem,),
+            "Support Skill Gem": (_skill_gem,),
+            # Currency-like items
+            "Currency": (_type_currency,),
+            "StackableCurrency": (_type_currency, _type_essence, _type_blight_item, _tattoo),
+            "DelveSocketableCurrency": (_type_currency,),
+            "DelveStackableSocketableCurrency": (_type_currency,),
+            "HideoutDoodad": (_type_currency, _type_hideout_doodad),
+            "Microtransaction": (_type_currency, _type_microtransaction),
+            "DivinationCard": (_type_currency,),
+            "IncubatorStackable": (_type_currency,),
+            "HarvestSeed": (_type_currency, _type_harvest_seed),
+            "HarvestPlantBooster": (_type_currency, _type_harvest_plant_booster),
+            # Labyrinth stuff
+            # 'LabyrinthItem': (),
+            "LabyrinthTrinket": (_type_labyrinth_trinket,),
+            # 'LabyrinthMapItem': (),
+            # Misc
+            "Map": (_type_map,),
+            "MapFragment": (_type_map_fragment_mods,),
+            "QuestItem": (_skip_quest_contracts,),
+            "AtlasRegionUpgradeItem": (),
+            "MetamorphosisDNA": (),
+            # heist league
+            "HeistContract": (_type_heist_contract,),
+            "HeistEquipmentWeapon": (_type_heist_equipment,),
+            "HeistEquipmentTool": (_type_heist_equipment,),
+            "HeistEquipmentUtility": (_type_heist_equipment,),
+            "HeistEquipmentReward": (_type_heist_equipment,),
+            "HeistBlueprint": (),
+            "Trinket": (),
+            "HeistObjective": (),
+        }
+    )
 
     _conflict_active_skill_gems_map = {
         "Metadata/Items/Gems/SkillGemArcticArmour": True,
@@ -3833,12 +3887,19 @@ class ItemsParser(SkillParserShared):
         else:
             return base_item_type["Name"]
 
+    _re_quest_book = re.compile(r"(?:SkillBooks|Act[0-9]+)/Book-(?P<id>.*)")
+    _re_quest_book_version = re.compile(r"v[0-9]$")
+    _re_quest_descent = re.compile(r"SkillBooks/Descent2_(?P<id>[0-9]+)")
+    _re_quest_bandit_respec = re.compile(r"SkillBooks/BanditRespec(?P<id>.+)")
+    _re_quest_firefly = re.compile(r"Metadata/Items/QuestItems/Act7/Firefly(?P<id>[0-9]+)$")
+
     def _conflict_quest_items(self, infobox, base_item_type, rr, language):
+        lang = self._lang if language == self._language else self._LANG[language]
         qid = base_item_type["Id"].replace("Metadata/Items/QuestItems/", "")
-        match = re.match(r"(?:SkillBooks|Act[0-9]+)/Book-(?P<id>.*)", qid)
+        match = self._re_quest_book.match(qid)
         if match:
             qid = match.group("id")
-            ver = re.findall(r"v[0-9]$", qid)
+            ver = self._re_quest_book_version.findall(qid)
             # Only need one of the skill books from "choice" quests
             if ver:
                 if ver[0] != "v0":
@@ -3851,26 +3912,23 @@ class ItemsParser(SkillParserShared):
                 console("Quest %s not found" % qid, msg=Msg.warning)
         else:
             # Descent skill books
-            match = re.match(r"SkillBooks/Descent2_(?P<id>[0-9]+)", qid)
+            match = self._re_quest_descent.match(qid)
             if match:
                 return base_item_type["Name"] + " (%s %s)" % (
-                    self._LANG[language]["descent"],
+                    lang["descent"],
                     match.group("id"),
                 )
             else:
                 # Bandit respec
-                match = re.match(r"SkillBooks/BanditRespec(?P<id>.+)", qid)
+                match = self._re_quest_bandit_respec.match(qid)
                 if match:
                     return base_item_type["Name"] + " (%s)" % match.group("id")
                 else:
-                    match = re.match(
-                        r"Metadata/Items/QuestItems/Act7/Firefly(?P<id>[0-9]+)$",
-                        base_item_type["Id"],
-                    )
+                    match = self._re_quest_firefly.match(base_item_type["Id"])
                     if match:
                         pageid = "%s (%s)" % (
                             base_item_type["Name"],
-                            self._LANG[language]["of"] % (match.group("id"), 7),
+                            lang["of"] % (match.group("id"), 7),
                         )
                         infobox["inventory_icon"] = pageid
                         return pageid
@@ -3886,9 +3944,9 @@ class ItemsParser(SkillParserShared):
         # This is not perfect, but works currently.
         if ho["HideoutNPCsKey"]:
             if base_item_type["Id"].startswith("Metadata/Items/Hideout/HideoutWounded"):
-                name_fmt = self._LANG[self._language]["decoration_wounded"]
+                name_fmt = self._lang["decoration_wounded"]
             else:
-                name_fmt = self._LANG[self._language]["decoration"]
+                name_fmt = self._lang["decoration"]
             name = name_fmt % (
                 base_item_type["Name"],
                 ho["HideoutNPCsKey"]["Hideout_NPCsKey"]["ShortName"],
@@ -3975,7 +4033,8 @@ class ItemsParser(SkillParserShared):
                 for cls in parsed_args.item_class_id
             ]
         elif parsed_args.item_class:
-            self.rr["ItemClasses.dat64"].build_index("Name")
+            if "Name" not in self.rr["ItemClasses.dat64"].index:
+                self.rr["ItemClasses.dat64"].build_index("Name")
             return [
                 self.rr["ItemClasses.dat64"].index["Name"][cls][0]["Name"]
                 for cls in parsed_args.item_class
@@ -4011,21 +4070,15 @@ class ItemsParser(SkillParserShared):
         )
 
     def by_filter(self, parsed_args):
-        if parsed_args.re_name:
-            parsed_args.re_name = re.compile(parsed_args.re_name, flags=re.UNICODE)
-        if parsed_args.re_id:
-            parsed_args.re_id = re.compile(parsed_args.re_id, flags=re.UNICODE)
-
-        items = []
-
-        for item in self.rr["BaseItemTypes.dat64"]:
-            if parsed_args.re_name and not parsed_args.re_name.match(item["Name"]):
-                continue
-
-            if parsed_args.re_id and not parsed_args.re_id.match(item["Id"]):
-                continue
+        match_name = parsed_args.re_name.match if parsed_args.re_name else None
+        match_id = parsed_args.re_id.match if parsed_args.re_id else None
 
-            items.append(item)
+        items = [
+            item
+            for item in self.rr["BaseItemTypes.dat64"]
+            if (match_name is None or match_name(item["Name"]))
+            and (match_id is None or match_id(item["Id"]))
+        ]
 
         return self._export(parsed_args, items)
 
@@ -4046,13 +4099,18 @@ class ItemsParser(SkillParserShared):
             )
 
         if (
-            base_item_type["ItemClassesKey"]["Id"] not in self._IGNORE_DROP_LEVEL_CLASSES
+            infobox["class_id"] not in self._IGNORE_DROP_LEVEL_CLASSES
             and m_id not in self._IGNORE_DROP_LEVEL_ITEMS_BY_ID
         ):
             infobox["drop_level"] = base_item_type["DropLevel"]
 
-        base_ot = ITFile(parent_or_file_system=self.file_system)
-        base_ot.read(self.file_system.get_file(base_item_type["InheritsFrom"] + ".it"))
+        # Many items share the same base, so only parse each inherited .it file once
+        inherits = base_item_type["InheritsFrom"]
+        base_ot = self._base_ot_cache.get(inherits)
+        if base_ot is None:
+            base_ot = ITFile(parent_or_file_system=self.file_system)
+            base_ot.read(self.file_system.get_file(inherits + ".it"))
+            self._base_ot_cache[inherits] = base_ot
         try:
             ot = self.it[m_id + ".it"]
         except FileNotFoundError:
@@ -4065,35 +4123,38 @@ class ItemsParser(SkillParserShared):
         if "enable_rarity" in ot["Mods"]:
             infobox["drop_rarities_ids"] = ", ".join(ot["Mods"]["enable_rarity"])
 
-        tags = [t["Id"] for t in base_item_type["TagsKeys"]]
-        infobox["tags"] = ", ".join(tags + list(ot["Base"]["tag"]))
+        infobox["tags"] = ", ".join(
+            chain(map(_get_id, base_item_type["TagsKeys"]), ot["Base"]["tag"])
+        )
 
         if not_new_map:
             infobox["metadata_id"] = m_id
 
         description = ot["Stack"].get("function_text")
+        help_text = ot["Base"].get("description_text")
+        if description or help_text:
+            client_strings = self.rr["ClientStrings.dat64"].index["Id"]
+
         if description:
-            infobox["description"] = self.rr["ClientStrings.dat64"].index["Id"][description]["Text"]
+            infobox["description"] = client_strings[description]["Text"]
 
-        help_text = ot["Base"].get("description_text")
         if help_text:
-            infobox["help_text"] = infobox["help_text"] = "<br>".join(
-                self.rr["ClientStrings.dat64"].index["Id"][help_text]["Text"].splitlines()
-            )
+            infobox["help_text"] = "<br>".join(client_strings[help_text]["Text"].splitlines())
 
-        for i, mod in enumerate(base_item_type["Implicit_ModsKeys"]):
-            infobox["implicit%s" % (i + 1)] = mod["Id"]
+        for i, mod in enumerate(base_item_type["Implicit_ModsKeys"], start=1):
+            infobox[f"implicit{i}"] = mod["Id"]
 
     def _process_name_conflicts(self, infobox, base_item_type, language):
         rr = self.rr2 if language != self._language else self.rr
-        # Get the base item of other language
-        base_item_type = rr["BaseItemTypes.dat64"][base_item_type.rowid]
+        base_item_types = rr["BaseItemTypes.dat64"]
+        if rr is self.rr2:
+            # Get the base item of other language; items passed in already come from self.rr
+            base_item_type = base_item_types[base_item_type.rowid]
 
         name = base_item_type["Name"]
         cls_id = base_item_type["ItemClassesKey"]["Id"]
         m_id = base_item_type["Id"]
-        override = self._NAME_OVERRIDE_BY_ID[language].get(m_id)
-        appendix = self._NAME_APPENDIX_BY_ID[language].get(m_id)
+        override, appendix = self._NAME_DECORATION_BY_ID[language].get(m_id, (None, None))
 
         if override is not None:
             name = override
@@ -4101,7 +4162,7 @@ class ItemsParser(SkillParserShared):
         if appendix is not None:
             name += appendix
             infobox["inventory_icon"] = name
-        elif cls_id == "Map" or len(rr["BaseItemTypes.dat64"].index["Name"][name]) > 1:
+        elif cls_id == "Map" or len(base_item_types.index["Name"][name]) > 1:
             resolver = self._conflict_resolver_map.get(cls_id)
 
             if resolver:
@@ -4128,23 +4189,17 @@ class ItemsParser(SkillParserShared):
         return name
 
     def _export(self, parsed_args, items):
-        classes = self._parse_class_filter(parsed_args)
+        classes = frozenset(self._parse_class_filter(parsed_args))
         if classes:
             items = [item for item in items if item["ItemClassesKey"]["Name"] in classes]
         else:
-            items = [
-                item
-                for item in items
-                if item["ItemClassesKey"]["Name"] not in self._EXCLUDE_CLASSES
-            ]
+            excluded = self._EXCLUDE_CLASSES
+            items = [item for item in items if item["ItemClassesKey"]["Name"] not in excluded]
 
         self._parsed_args = parsed_args
         console("Found %s items. Removing disabled items..." % len(items))
-        items = [
-            base_item_type
-            for base_item_type in items
-            if base_item_type["Id"] not in self._SKIP_ITEMS_BY_ID
-        ]
+        skip = self._SKIP_ITEMS_BY_ID
+        items = [item for item in items if item["Id"] not in skip]
         console("%s items left for processing." % len(items))
 
         console("Loading additional files - this may take a while...")
@@ -4154,116 +4209,200 @@ class ItemsParser(SkillParserShared):
         self.rr["BaseItemTypes.dat64"].build_index("Name")
         self.rr["MapPurchaseCosts.dat64"].build_index("Tier")
 
-        if self._language != "English" and parsed_args.english_file_link:
-            self.rr2["BaseItemTypes.dat64"].build_index("Name")
+        language = self._language
+        english_file_link = language != "English" and parsed_args.english_file_link
+        if english_file_link:
+            rr2_base_item_types = self.rr2["BaseItemTypes.dat64"]
+            rr2_base_item_types.build_index("Name")
 
         console("Processing item information...")
         self.num_processed = 0
+        # Bind loop invariants once rather than resolving them for every item
+        item_count = len(items)
+        cls_map_get = self._cls_map.get
+        drop_disabled = self._DROP_DISABLED_ITEMS_BY_ID
+        placeholder_images = self._PLACEHOLDER_IMAGES
+        store_images = parsed_args.store_images
+        get_file = self.file_system.get_file
+
+        with self._image_jobs(parsed_args) as run_image_job:
+            for base_item_type in items:
+                name = base_item_type["Name"]
+                cls_id = base_item_type["ItemClassesKey"]["Id"]
+                m_id = base_item_type["Id"]
+
+                self._print_item_rowid(item_count, base_item_type)
+
+                infobox = {}
+                self._process_base_item_type(base_item_type, infobox)
+                self._process_purchase_costs(base_item_type, infobox)
+
+                funcs = cls_map_get(cls_id)
+                if funcs:
+                    fail = False
+                    for f in funcs:
+                        if not f(self, infobox, base_item_type):
+                            fail = True
+                            console(
+                                f'Required extra info for item "{name}" with class id '
+                                f'"{cls_id}" not found. Skipping.',
+                                msg=Msg.warning,
+                            )
+                            break
+                    if fail:
+                        continue
 
-        for base_item_type in items:
-            name = base_item_type["Name"]
-            cls_id = base_item_type["ItemClassesKey"]["Id"]
-            m_id = base_item_type["Id"]
-
-            self._print_item_rowid(len(items), base_item_type)
-
-            infobox = OrderedDict()
-            self._process_base_item_type(base_item_type, infobox)
-            self._process_purchase_costs(base_item_type, infobox)
-
-            funcs = self._cls_map.get(cls_id)
-            if funcs:
-                fail = False
-                for f in funcs:
-                    if not f(self, infobox, base_item_type):
-                        fail = True
-                        console(
-                            f'Required extra info for item "{name}" with class id '
-                            f'"{cls_id}" not found. Skipping.',
-                            msg=Msg.warning,
-                        )
-                        break
-                if fail:
+                # handle items with duplicate name entries
+                # Maps must be handled in any case due to unique naming style of
+                # pages
+                page = self._process_name_conflicts(infobox, base_item_type, language)
+                if page is None:
                     continue
+                if english_file_link:
+                    icon = self._process_name_conflicts(infobox, base_item_type, "English")
+                    if cls_id == "DivinationCard":
+                        key = "card_art"
+                    else:
+                        key = "inventory_icon"
+
+                    if icon:
+                        infobox[key] = icon
+                    else:
+                        infobox[key] = rr2_base_item_types[base_item_type.rowid]["Name"]
+
+                # putting this last since it's usually manually added
+                if m_id in drop_disabled:
+                    infobox["drop_enabled"] = False
+
+                inventory_icon = infobox.get("inventory_icon") or page
+                if ":" in inventory_icon:
+                    infobox["inventory_icon"] = inventory_icon.replace(":", "")
+
+                cond = ItemWikiCondition(
+                    data=infobox,
+                    cmdargs=parsed_args,
+                )
 
-            # handle items with duplicate name entries
-            # Maps must be handled in any case due to unique naming style of
-            # pages
-            page = self._process_name_conflicts(infobox, base_item_type, self._language)
-            if page is None:
-                continue
-            if self._language != "English" and parsed_args.english_file_link:
-                icon = self._process_name_conflicts(infobox, base_item_type, "English")
-                if cls_id == "DivinationCard":
-                    key = "card_art"
-                else:
-                    key = "inventory_icon"
-
-                if icon:
-                    infobox[key] = icon
-                else:
-                    infobox[key] = self.rr2["BaseItemTypes.dat64"][base_item_type.rowid]["Name"]
-
-            # putting this last since it's usually manually added
-            if m_id in self._DROP_DISABLED_ITEMS_BY_ID:
-                infobox["drop_enabled"] = False
-
-            inventory_icon = infobox.get("inventory_icon") or page
-            if ":" in inventory_icon:
-                infobox["inventory_icon"] = inventory_icon.replace(":", "")
-
-            cond = ItemWikiCondition(
-                data=infobox,
-                cmdargs=parsed_args,
-            )
-
-            wiki_page = [
-                {
-                    "page": page,
-                    "condition": cond,
-                }
-            ]
-
-            if infobox.get("cosmetic_type", None) == "Armour Skin" and "Armour" not in page:
-                wiki_page.append(
+                wiki_page = [
                     {
-                        "page": page + " Armour",
+                        "page": page,
                         "condition": cond,
                     }
-                )
-
-            ddsfile = base_item_type["ItemVisualIdentityKey"]["DDSFile"]
-            if ddsfile and ddsfile in self._PLACEHOLDER_IMAGES:
-                warnings.warn(
-                    'Item "%s" has placeholder icon art. Skipping.' % base_item_type["Name"]
-                )
-                continue
+                ]
 
-            r.add_result(
-                text=cond,
-                out_file="item_%s.txt" % page,
-                wiki_page=wiki_page,
-                wiki_message="Item exporter",
-            )
+                if infobox.get("cosmetic_type", None) == "Armour Skin" and "Armour" not in page:
+                    wiki_page.append(
+                        {
+                            "page": page + " Armour",
+                            "condition": cond,
+                        }
+                    )
 
-            if parsed_args.store_images:
-                if not ddsfile:
+                ddsfile = base_item_type["ItemVisualIdentityKey"]["DDSFile"]
+                if ddsfile and ddsfile in placeholder_images:
                     warnings.warn(
-                        'Missing 2d art inventory icon for item "%s"' % base_item_type["Name"]
+                        'Item "%s" has placeholder icon art. Skipping.' % base_item_type["Name"]
                     )
                     continue
 
-                self._write_dds(
-                    data=self.file_system.get_file(ddsfile),
-                    out_path=os.path.join(
-                        self._img_path,
-                        (infobox.get("inventory_icon") or page) + " inventory icon.dds",
-                    ),
-                    parsed_args=parsed_args,
+                r.add_result(
+                    text=cond,
+                    out_file="item_%s.txt" % page,
+                    wiki_page=wiki_page,
+                    wiki_message="Item exporter",
                 )
 
+                if store_images:
+                    if not ddsfile:
+                        warnings.warn('Missing 2d art inventory icon for item "%s"' % name)
+                        continue
+
+                    run_image_job(
+                        self._write_dds,
+                        data=get_file(ddsfile),
+                        out_path=os.path.join(
+                            self._img_path,
+                            (infobox.get("inventory_icon") or page) + " inventory icon.dds",
+                        ),
+                        parsed_args=parsed_args,
+                    )
+
         return r
 
+    @contextmanager
+    def _image_jobs(self, parsed_args):
+        """
+        Context manager providing a function that runs an image job, called as
+        run(func, **kwargs).
+
+        If image conversion was requested with more than one image thread, the
+        jobs are run on a thread pool, otherwise they are run immediately.
+        Files must still be read on the calling thread, as the file system is
+        not thread safe.
+
+        At most twice as many jobs as image threads are kept in flight, so the
+        file data held by pending jobs stays bounded. Finished jobs are checked
+        as they are drained, so errors are re-raised early; the remaining jobs
+        are finished and checked on exit.
+        """
+        if not parsed_args.convert_images or parsed_args.image_threads <= 1:
+            yield lambda func, **kwargs: func(**kwargs)
+            return
+
+        max_pending = 2 * parsed_args.image_threads
+        pending = set()
+
+        def run(func, **kwargs):
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending.difference_update(done)
+                for future in done:
+                    future.result()
+            pending.add(pool.submit(func, **kwargs))
+
+        with ThreadPoolExecutor(max_workers=parsed_args.image_threads) as pool:
+            yield run
+
+        for future in pending:
+            future.result()
+
+    def _write_atlas_icon(self, data, out_path, parsed_args, tint):
+        img = self._write_dds(data=data, out_path=out_path, parsed_args=parsed_args)
+
+        if tint and img is not None:
+            # Derive every tier color from the already decoded icon
+            ico_path = Path(out_path).with_suffix(".png")
+            for name, color in self._MAP_COLORS.items():
+                # Tint with tier color, this historically differs from the colorization
+                # used for composing map glyphs onto on the itemized map base.
+                midpoint = self._MAP_COLOR_MIDPOINTS[name]
+                _colorize_rgba(img, "black", "white", mid=color, midpoint=midpoint).save(
+                    ico_path.with_suffix(f".{name}.png")
+                )
+
+    def _write_map_icon(self, data, out_path, parsed_args, color, base_img):
+        # Recolor and layer the map's icon onto the base map in memory and only
+        # write the finished image
+        img = decode_dds(data)
+
+        # This isn't quite how the game actually makes these map icons,
+        # so it isn't ideal, but it works.
+        if color:
+            img = _colorize_rgba(img, "black", color)
+
+        if base_img is not None:
+            # Center the icon on a copy of the shared base image, only blending the icon's area
+            x = (base_img.size[0] - img.size[0]) // 2
+            y = (base_img.size[1] - img.size[1]) // 2
+            composite = base_img.copy()
+            composite.alpha_composite(
+                img, dest=(max(x, 0), max(y, 0)), source=(max(-x, 0), max(-y, 0))
+            )
+            img = composite
+
+        img.save(fix_path(out_path).replace(".dds", parsed_args.convert_images))
+        console('Converted "%s" to png' % out_path)
+
     def _print_item_rowid(self, export_row_count, base_item_type):
         # If we're printing less than 100 rows, print every rowid
         if export_row_count <= 100:
@@ -4277,40 +4416,38 @@ class ItemsParser(SkillParserShared):
         return
 
     def _format_map_name(self, base_item_type, map_series=None, language=None):
-        if language is None:
-            language = self._language
-        if map_series is None:
-            if "Harbinger" in base_item_type["Id"]:
-                key = re.sub(r"^.*Harbinger", "", base_item_type["Id"])
-                return f"{base_item_type['Name']} ({self._LANG[language][key]})"
+        name = base_item_type["Name"]
+        m_id = base_item_type["Id"]
+        if "Harbinger" in m_id:
+            if language is None or language == self._language:
+                lang = self._lang
             else:
-                return f"{base_item_type['Name']}"
-        elif "Harbinger" in base_item_type["Id"]:
-            return "%s (%s) (%s)" % (
-                base_item_type["Name"],
-                self._LANG[language][re.sub(r"^.*Harbinger", "", base_item_type["Id"])],
-                map_series["Name"],
-            )
-        else:
-            return f"{base_item_type['Name']} ({map_series['Name']})"
+                lang = self._LANG[language]
+            name = f"{name} ({lang[m_id.rpartition('Harbinger')[2]]})"
+
+        if map_series is None:
+            return name
+        return f"{name} ({map_series['Name']})"
 
     def _get_map_series(self, parsed_args):
-        self.rr["MapSeries.dat64"].build_index("Id")
-        self.rr["MapSeries.dat64"].build_index("Name")
+        map_series_dat = self.rr["MapSeries.dat64"]
+        for column in ("Id", "Name"):
+            if column not in map_series_dat.index:
+                map_series_dat.build_index(column)
         if parsed_args.map_series_id is not None:
             try:
-                map_series = self.rr["MapSeries.dat64"].index["Id"][parsed_args.map_series_id]
+                map_series = map_series_dat.index["Id"][parsed_args.map_series_id]
             except IndexError:
                 console("Invalid map series id", msg=Msg.warning)
                 return False
         elif parsed_args.map_series is not None:
             try:
-                map_series = self.rr["MapSeries.dat64"].index["Name"][parsed_args.map_series][0]
+                map_series = map_series_dat.index["Name"][parsed_args.map_series][0]
             except IndexError:
                 console("Invalid map series name", msg=Msg.warning)
                 return False
         else:
-            map_series = self.rr["MapSeries.dat64"][-1]
+            map_series = map_series_dat[-1]
             console(
                 'No map series specified. Using latest series "%s".' % (map_series["Name"],),
                 msg=Msg.warning,
@@ -4349,39 +4486,23 @@ class ItemsParser(SkillParserShared):
         )
 
         # === Maps from Atlas ===
-        for atlas_node in self.rr["AtlasNode.dat64"]:
-            if not atlas_node["ItemVisualIdentityKey"]["DDSFile"]:
-                warnings.warn(
-                    "Missing 2d art inventory icon at index %s" % atlas_node.index,
-                )
-                continue
-
-            name = atlas_node["WorldAreasKey"]["Name"]
-
-            ico = os.path.join(self._img_path, name + ".dds")
-
-            self._write_dds(
-                data=self.file_system.get_file(atlas_node["ItemVisualIdentityKey"]["DDSFile"]),
-                out_path=ico,
-                parsed_args=parsed_args,
-            )
+        with self._image_jobs(parsed_args) as run_image_job:
+            for atlas_node in self.rr["AtlasNode.dat64"]:
+                if not atlas_node["ItemVisualIdentityKey"]["DDSFile"]:
+                    warnings.warn(
+                        "Missing 2d art inventory icon at index %s" % atlas_node.index,
+                    )
+                    continue
 
-            if "Unique" not in atlas_node["WorldAreasKey"]["Id"]:
-                ico = ico.replace(".dds", ".png")
-                for name, color in self._MAP_COLORS.items():
-                    ico_path = Path(ico)
-                    out_path = ico_path.with_suffix(f".{name}.png")
-                    if not os.path.isfile(ico_path):
-                        continue
+                name = atlas_node["WorldAreasKey"]["Name"]
 
-                    # Tint with tier color, this historically differs from the colorization
-                    # used for composing map glyphs onto on the itemized map base.
-                    img = Image.open(ico_path)
-                    midpoint = self._MAP_COLOR_MIDPOINTS[name]
-                    img = _colorize_rgba(
-                        img, "black", "white", mid=f"rgb({color})", midpoint=midpoint
-                    )
-                    img.save(out_path)
+                run_image_job(
+                    self._write_atlas_icon,
+                    data=self.file_system.get_file(atlas_node["ItemVisualIdentityKey"]["DDSFile"]),
+                    out_path=os.path.join(self._img_path, name + ".dds"),
+                    parsed_args=parsed_args,
+                    tint="Unique" not in atlas_node["WorldAreasKey"]["Id"],
+                )
 
         return r
 
@@ -4403,7 +4524,8 @@ class ItemsParser(SkillParserShared):
         # atlas info should be stored
         latest = map_series == self.rr["MapSeries.dat64"][-1]
 
-        self.rr["AtlasNode.dat64"].build_index("MapsKey")
+        if "MapsKey" not in self.rr["AtlasNode.dat64"].index:
+            self.rr["AtlasNode.dat64"].build_index("MapsKey")
         names = set(parsed_args.name)
         map_series_tiers = {}
         # For each map, save off the atlas node
@@ -4438,192 +4560,191 @@ class ItemsParser(SkillParserShared):
             self._image_init(parsed_args)
             base_ico = os.path.join(self._img_path, "Map base icon.dds")
 
-            self._write_dds(
+            # Decoded once and only read by the image jobs
+            base_img = self._write_dds(
                 data=self.file_system.get_file(map_series["BaseIcon_DDSFile"]),
                 out_path=base_ico,
                 parsed_args=parsed_args,
             )
 
-            base_ico = base_ico.replace(".dds", ".png")
-            base_img = Image.open(base_ico)
-
-        self.rr["MapSeriesTiers.dat64"].build_index("MapsKey")
-        self.rr["MapPurchaseCosts.dat64"].build_index("Tier")
+        if "Tier" not in self.rr["MapPurchaseCosts.dat64"].index:
+            self.rr["MapPurchaseCosts.dat64"].build_index("Tier")
         # self.rr['UniqueMaps.dat64'].build_index('WorldAreasKey')
 
-        for row, atlas_node in map_series_tiers.items():
-            maps = row["MapsKey"]
-            base_item_type = maps["BaseItemTypesKey"]
-            name = self._format_map_name(base_item_type, map_series)
-            tier = row["%sTier" % map_series["Id"]]
-
-            # Base info
-            infobox = OrderedDict()
-            self._process_base_item_type(base_item_type, infobox, not_new_map=False)
-            self._type_map(infobox, base_item_type)
-
-            # Overrides
-            infobox["map_tier"] = tier
-            infobox["map_area_level"] = 67 + tier
-            # Map start dropping at one tier lower, with the exception of
-            # tier 1 maps which can drop rather early
-            infobox["drop_level"] = 66 + tier if tier > 1 else 58
-            infobox["unique_map_area_level"] = 67 + tier
-            infobox["map_series"] = map_series["Name"]
-            infobox["inventory_icon"] = name
-
-            if self._language != "English" and parsed_args.english_file_link:
-                infobox["inventory_icon"] = self._format_map_name(
-                    self.rr2["BaseItemTypes.dat64"][base_item_type.rowid],
-                    self.rr2["MapSeries.dat64"][map_series.rowid],
-                    "English",
-                )
-            else:
+        # Bind loop invariants once rather than resolving them for every map
+        purchase_costs_by_tier = self.rr["MapPurchaseCosts.dat64"].index["Tier"]
+        tier_column = "%sTier" % map_series["Id"]
+        english_file_link = self._language != "English" and parsed_args.english_file_link
+        if english_file_link:
+            rr2_base_item_types = self.rr2["BaseItemTypes.dat64"]
+            english_map_series = self.rr2["MapSeries.dat64"][map_series.rowid]
+
+        with self._image_jobs(parsed_args) as run_image_job:
+            for row, atlas_node in map_series_tiers.items():
+                maps = row["MapsKey"]
+                base_item_type = maps["BaseItemTypesKey"]
+                name = self._format_map_name(base_item_type, map_series)
+                tier = row[tier_column]
+
+                # Base info
+                infobox = {}
+                self._process_base_item_type(base_item_type, infobox, not_new_map=False)
+                self._type_map(infobox, base_item_type)
+
+                # Overrides
+                infobox["map_tier"] = tier
+                infobox["map_area_level"] = 67 + tier
+                # Map start dropping at one tier lower, with the exception of
+                # tier 1 maps which can drop rather early
+                infobox["drop_level"] = 66 + tier if tier > 1 else 58
+                infobox["unique_map_area_level"] = 67 + tier
+                infobox["map_series"] = map_series["Name"]
                 infobox["inventory_icon"] = name
 
-            starting_tier = tier
-            if atlas_node:
-                if latest:
-                    # 3.15
-                    # It ~~looks~~ like this doesnt affect the export, but it was throwing an error.
-                    # TODO: look into this.
-
-                    # infobox['atlas_x'] = atlas_node['X']
-                    # infobox['atlas_y'] = atlas_node['Y']
-
-                    minimum = 0
-                    connections = defaultdict(lambda: ["False" for i in range(0, 5)])
-                    for i in range(0, 5):
-                        # We don't know what these coordinates are for at this point.
-                        # infobox['atlas_x%s' % i] = atlas_node['X%s' % i]
-                        tier = atlas_node["Tier%s" % i]
-                        infobox["atlas_map_tier%s" % i] = tier
-                        if tier:
-                            if minimum == 0:
-                                minimum = i
-
-                    # The indexing isn't working well.
-                    # It is using the entire mapped out object as keys.
-                    # We can hold off on all connections for now. It's fairly obvious that unique
-                    # maps are connected to their normal counterpart.
-                    # See if there's a unique map for this base map.
-                    # unique_maps_area_index = self.rr['UniqueMaps.dat64'].index['WorldAreasKey']
-                    # area = atlas_node['MapsKey']['Unique_WorldAreasKey']
-                    # if area in unique_maps_area_index:
-                    #     #print(unique_maps_area_index.keys(), flush=True)
-                    #     key = '%s (%s)' % (
-                    #         unique_maps_area_index[area]['WordsKey']['Text'],
-                    #         map_series['Name']
-                    #     )
-                    #     connections[key][1] = 'True'
-
-                    infobox["atlas_region_minimum"] = minimum
-                    for i, (k, v) in enumerate(connections.items(), start=1):
-                        infobox["atlas_connection%s_target" % i] = k
-                        infobox["atlas_connection%s_tier" % i] = ", ".join(v)
-
-                infobox["flavour_text"] = (
-                    atlas_node["FlavourTextKey"]["Text"].replace("\n", "<br>").replace("\r", "")
-                )
-
-            if 0 < tier < 17:
-                self._process_purchase_costs(
-                    self.rr["MapPurchaseCosts.dat64"].index["Tier"][tier], infobox
-                )
+                if english_file_link:
+                    infobox["inventory_icon"] = self._format_map_name(
+                        rr2_base_item_types[base_item_type.rowid],
+                        english_map_series,
+                        "English",
+                    )
+                else:
+                    infobox["inventory_icon"] = name
+
+                starting_tier = tier
+                if atlas_node:
+                    if latest:
+                        # 3.15
+                        # It ~~looks~~ like this doesnt affect the export, but it was throwing
+                        # an error.
+                        # TODO: look into this.
+
+                        # infobox['atlas_x'] = atlas_node['X']
+                        # infobox['atlas_y'] = atlas_node['Y']
+
+                        minimum = 0
+                        for i, (tier_key, infobox_key) in enumerate(_ATLAS_TIER_KEYS):
+                            # We don't know what these coordinates are for at this point.
+                            # infobox['atlas_x%s' % i] = atlas_node['X%s' % i]
+                            tier = atlas_node[tier_key]
+                            infobox[infobox_key] = tier
+                            if tier:
+                                if minimum == 0:
+                                    minimum = i
+
+                        # The indexing isn't working well.
+                        # It is using the entire mapped out object as keys.
+                        # We can hold off on all connections for now. It's fairly obvious that
+                        # unique maps are connected to their normal counterpart.
+                        # See if there's a unique map for this base map.
+                        # connections = {}
+                        # unique_maps_area_index = self.rr['UniqueMaps.dat64'].index[
+                        #     'WorldAreasKey'
+                        # ]
+                        # area = atlas_node['MapsKey']['Unique_WorldAreasKey']
+                        # if area in unique_maps_area_index:
+                        #     #print(unique_maps_area_index.keys(), flush=True)
+                        #     key = '%s (%s)' % (
+                        #         unique_maps_area_index[area]['WordsKey']['Text'],
+                        #         map_series['Name']
+                        #     )
+                        #     connections.setdefault(key, ['False'] * 5)[1] = 'True'
+                        # for i, (k, v) in enumerate(connections.items(), start=1):
+                        #     infobox['atlas_connection%s_target' % i] = k
+                        #     infobox['atlas_connection%s_tier' % i] = ', '.join(v)
+
+                        infobox["atlas_region_minimum"] = minimum
+
+                    infobox["flavour_text"] = (
+                        atlas_node["FlavourTextKey"]["Text"].replace("\n", "<br>").replace("\r", "")
+                    )
 
-            # Skip maps that aren't in the rotation this map series.
-            if tier == 0:
-                continue
+                if 0 < tier < 17:
+                    self._process_purchase_costs(purchase_costs_by_tier[tier], infobox)
 
-            """if maps['UpgradedFrom_MapsKey']:
-                infobox['upgeaded_from_set1_group1_page'] = '%s (%s)' % (
-                    maps['UpgradedFrom_MapsKey']['BaseItemTypesKey']['Name'],
-                    map_series['Name']
-                )
-                infobox['upgraded_from_set1_group1_amount'] = 3"""
+                # Skip maps that aren't in the rotation this map series.
+                if tier == 0:
+                    continue
 
-            infobox["release_version"] = self._MAP_RELEASE_VERSION[map_series["Id"]]
+                """if maps['UpgradedFrom_MapsKey']:
+                    infobox['upgeaded_from_set1_group1_page'] = '%s (%s)' % (
+                        maps['UpgradedFrom_MapsKey']['BaseItemTypesKey']['Name'],
+                        map_series['Name']
+                    )
+                    infobox['upgraded_from_set1_group1_amount'] = 3"""
 
-            if not latest:
-                infobox["drop_enabled"] = "False"
+                infobox["release_version"] = self._MAP_RELEASE_VERSION[map_series["Id"]]
 
-            cond = MapItemWikiCondition(
-                data=infobox,
-                cmdargs=parsed_args,
-            )
+                if not latest:
+                    infobox["drop_enabled"] = "False"
 
-            r.add_result(
-                text=cond,
-                out_file=f"map_{name}.txt",
-                wiki_page=[
-                    {
-                        "page": f"Map:{name}",
-                        "condition": cond,
-                    }
-                ],
-                wiki_message="Map exporter",
-            )
+                cond = MapItemWikiCondition(
+                    data=infobox,
+                    cmdargs=parsed_args,
+                )
 
-            # Export map icons
-            if parsed_args.store_images:
-                # Warn about and skip maps that aren't on the atlas and may not exist.
-                if (
-                    atlas_node is None
-                    and base_item_type["Id"] not in MAPS_IN_SERIES_BUT_NOT_ON_ATLAS
-                ):
-                    warnings.warn(
-                        f"{base_item_type['Name']} ({base_item_type['Id']}) is not currently on the"
-                        " Atlas"
-                    )
-                    continue
+                r.add_result(
+                    text=cond,
+                    out_file=f"map_{name}.txt",
+                    wiki_page=[
+                        {
+                            "page": f"Map:{name}",
+                            "condition": cond,
+                        }
+                    ],
+                    wiki_message="Map exporter",
+                )
 
-                # Warn about and skip maps that are on atlas but have no icon.
-                elif atlas_node is not None and not atlas_node["ItemVisualIdentityKey"]["DDSFile"]:
-                    warnings.warn(
-                        f'Missing 2d art inventory icon for item "{base_item_type["Name"]}"'
-                    )
-                    continue
+                # Export map icons
+                if parsed_args.store_images:
+                    # Warn about and skip maps that aren't on the atlas and may not exist.
+                    if (
+                        atlas_node is None
+                        and base_item_type["Id"] not in MAPS_IN_SERIES_BUT_NOT_ON_ATLAS
+                    ):
+                        warnings.warn(
+                            f"{base_item_type['Name']} ({base_item_type['Id']}) is not currently"
+                            " on the Atlas"
+                        )
+                        continue
 
-                ico = os.path.join(self._img_path, name + " inventory icon.dds")
+                    # Warn about and skip maps that are on atlas but have no icon.
+                    elif (
+                        atlas_node is not None
+                        and not atlas_node["ItemVisualIdentityKey"]["DDSFile"]
+                    ):
+                        warnings.warn(
+                            f'Missing 2d art inventory icon for item "{base_item_type["Name"]}"'
+                        )
+                        continue
 
-                # If the atlas doesn't point to an icon, use the base_item_type for the icon.
-                if atlas_node is not None:
-                    dds_file_path = atlas_node["ItemVisualIdentityKey"]["DDSFile"]
-                else:
-                    dds_file_path = base_item_type["ItemVisualIdentityKey"]["DDSFile"]
+                    ico = os.path.join(self._img_path, name + " inventory icon.dds")
 
-                # Save off the map's icon (which still needs to be layered onto the base map)
-                self._write_dds(
-                    data=self.file_system.get_file(dds_file_path),
-                    out_path=ico,
-                    parsed_args=parsed_args,
-                )
-                ico = ico.replace(".dds", ".png")
-                img = Image.open(ico)
-                img.save(ico)
+                    # If the atlas doesn't point to an icon, use the base_item_type for the icon.
+                    if atlas_node is not None:
+                        dds_file_path = atlas_node["ItemVisualIdentityKey"]["DDSFile"]
+                    else:
+                        dds_file_path = base_item_type["ItemVisualIdentityKey"]["DDSFile"]
 
-                # Recolor the map icon if appropriate and layer the map icon with the base icon.
-                if base_item_type["Id"] not in MAPS_TO_SKIP_COLORING:
+                    # Recolor the map icon if appropriate and layer the map icon with the base icon.
                     color = None
-                    if 5 < starting_tier <= 10:
-                        color = self._MAP_COLORS["mid tier"]
-                    if 10 < starting_tier:
-                        color = self._MAP_COLORS["high tier"]
-
-                    # This isn't quite how the game actually makes these map icons,
-                    # so it isn't ideal, but it works.
-                    if color:
-                        img = _colorize_rgba(img, "black", f"rgb({color})")
-                        img.save(ico)
-
-                if base_item_type["Id"] not in MAPS_TO_SKIP_COMPOSITING:
-                    canvas = Image.new(base_img.mode, base_img.size, (0, 0, 0, 0))
-                    paste_origin = (
-                        (base_img.size[0] - img.size[0]) // 2,
-                        (base_img.size[1] - img.size[1]) // 2,
+                    if base_item_type["Id"] not in MAPS_TO_SKIP_COLORING:
+                        if 5 < starting_tier <= 10:
+                            color = self._MAP_COLORS["mid tier"]
+                        if 10 < starting_tier:
+                            color = self._MAP_COLORS["high tier"]
+
+                    run_image_job(
+                        self._write_map_icon,
+                        data=self.file_system.get_file(dds_file_path),
+                        out_path=ico,
+                        parsed_args=parsed_args,
+                        color=color,
+                        base_img=(
+                            base_img
+                            if base_item_type["Id"] not in MAPS_TO_SKIP_COMPOSITING
+                            else None
+                        ),
                     )
-                    canvas.paste(img, paste_origin)
-                    Image.alpha_composite(base_img, canvas).save(ico)
 
         return r
 
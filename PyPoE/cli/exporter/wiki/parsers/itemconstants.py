@@ -41,33 +41,39 @@ Documentation
 # =============================================================================
 
 
-MAPS_IN_SERIES_BUT_NOT_ON_ATLAS = {
-    "Metadata/Items/Maps/MapWorldsHarbingerUber",
-    "Metadata/Items/Maps/MapWorldsHarbingerHigh",
-    "Metadata/Items/Maps/MapWorldsHarbingerMid",
-    "Metadata/Items/Maps/MapWorldsHarbingerLow",
-    "Metadata/Items/Maps/MapWorldsPhoenix",
-    "Metadata/Items/Maps/MapWorldsChimera",
-    "Metadata/Items/Maps/MapWorldsHydra",
-    "Metadata/Items/Maps/MapWorldsMinotaur",
-    "Metadata/Items/Maps/MapWorldsVaalTemple",
-}
+MAPS_IN_SERIES_BUT_NOT_ON_ATLAS = frozenset(
+    {
+        "Metadata/Items/Maps/MapWorldsHarbingerUber",
+        "Metadata/Items/Maps/MapWorldsHarbingerHigh",
+        "Metadata/Items/Maps/MapWorldsHarbingerMid",
+        "Metadata/Items/Maps/MapWorldsHarbingerLow",
+        "Metadata/Items/Maps/MapWorldsPhoenix",
+        "Metadata/Items/Maps/MapWorldsChimera",
+        "Metadata/Items/Maps/MapWorldsHydra",
+        "Metadata/Items/Maps/MapWorldsMinotaur",
+        "Metadata/Items/Maps/MapWorldsVaalTemple",
+    }
+)
 
-MAPS_TO_SKIP_COLORING = {
-    "Metadata/Items/Maps/MapWorldsHarbingerUber",
-    "Metadata/Items/Maps/MapWorldsHarbingerHigh",
-    "Metadata/Items/Maps/MapWorldsHarbingerMid",
-    "Metadata/Items/Maps/MapWorldsHarbingerLow",
-    "Metadata/Items/Maps/MapWorldsPhoenix",
-    "Metadata/Items/Maps/MapWorldsChimera",
-    "Metadata/Items/Maps/MapWorldsHydra",
-    "Metadata/Items/Maps/MapWorldsMinotaur",
-    "Metadata/Items/Maps/MapWorldsVaalTemple",
-}
+MAPS_TO_SKIP_COLORING = frozenset(
+    {
+        "Metadata/Items/Maps/MapWorldsHarbingerUber",
+        "Metadata/Items/Maps/MapWorldsHarbingerHigh",
+        "Metadata/Items/Maps/MapWorldsHarbingerMid",
+        "Metadata/Items/Maps/MapWorldsHarbingerLow",
+        "Metadata/Items/Maps/MapWorldsPhoenix",
+        "Metadata/Items/Maps/MapWorldsChimera",
+        "Metadata/Items/Maps/MapWorldsHydra",
+        "Metadata/Items/Maps/MapWorldsMinotaur",
+        "Metadata/Items/Maps/MapWorldsVaalTemple",
+    }
+)
 
-MAPS_TO_SKIP_COMPOSITING = {
-    "Metadata/Items/Maps/MapWorldsHarbingerUber",
-    "Metadata/Items/Maps/MapWorldsHarbingerHigh",
-    "Metadata/Items/Maps/MapWorldsHarbingerMid",
-    "Metadata/Items/Maps/MapWorldsHarbingerLow",
-}
+MAPS_TO_SKIP_COMPOSITING = frozenset(
+    {
+        "Metadata/Items/Maps/MapWorldsHarbingerUber",
+        "Metadata/Items/Maps/MapWorldsHarbingerHigh",
+        "Metadata/Items/Maps/MapWorldsHarbingerMid",
+        "Metadata/Items/Maps/MapWorldsHarbingerLow",
+    }
+)
@@ -154,10 +154,13 @@ class FileSystem:
             except FileNotFoundError:
                 pass
             else:
-                if self.ggpk:
-                    fr.bundle.read(self.ggpk[fr.bundle.ggpk_path].record.extract())
-                else:
-                    fr.bundle.read(os.path.join(self.root_path, fr.bundle.ggpk_path))
+                # Bundles are kept decompressed once read, so only pull the raw
+                # bundle out of the GGPK or from disk the first time it is needed
+                if fr.bundle.contents is None:
+                    if self.ggpk:
+                        fr.bundle.read(self.ggpk[fr.bundle.ggpk_path].record.extract())
+                    else:
+                        fr.bundle.read(os.path.join(self.root_path, fr.bundle.ggpk_path))
                 return fr.get_file()
 
         # If the file is in the index, this section can't be reached
@@ -220,7 +223,8 @@ class FileSystem:
             return self.extract_dds(data)
         else:
             size = int.from_bytes(data[:4], "little")
-            dec = brotli.decompress(data[4:])
+            # Skip the size header without copying the compressed payload
+            dec = brotli.decompress(memoryview(data)[4:])
             if len(dec) != size:
                 raise ParserError("Decompressed size does not match size in the header")
             return dec
@@ -178,10 +178,11 @@ class AbstractKeyValueSection(dict):
                         v = OrderedDict(((v, True),))
             elif k in self.APPEND_KEYS:
                 if isinstance(v, list):
+                    # Build a new list so other's values are never aliased or modified
                     if k in self:
-                        v += self[k]
+                        v = v + self[k]
                     else:
-                        pass
+                        v = list(v)
                 else:
                     if k in self:
                         self[k].append(v)
@@ -396,6 +397,9 @@ class AbstractKeyValueFile(AbstractFile, defaultdict):
         """
         Merge with other file.
 
+        The other file is left unmodified, so the same instance may be merged
+        into several files.
+
         Parameters
         ----------
         other : AbstractKeyValueFile
@@ -414,10 +418,10 @@ class AbstractKeyValueFile(AbstractFile, defaultdict):
             )
 
         for k, v in other.items():
-            if k in self:
-                self[k].merge(v)
-            else:
-                self[k] = v
+            if k not in self:
+                # Copy rather than share the section so other can be merged again later
+                self[k] = v.__class__(parent=self, name=v.name)
+            self[k].merge(v)
 
 
 class AbstractKeyValueFileCache(AbstractFileCache):
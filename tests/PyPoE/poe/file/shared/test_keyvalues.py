@@ -167,6 +167,20 @@ class TestKeyValuesFile:
 
             assert kf_target == kf_should
 
+    def test_merge_leaves_other_unmodified(self, kf_file):
+        other = KeyValuesFile()
+        other["Append"] = KeyValuesSectionAppend(parent=other)
+        other["Append"]["key"] = [4, 5]
+        other["New"] = KeyValuesSectionHash(parent=other, name="New")
+        other["New"]["key"] = 1
+
+        kf_file.merge(other)
+
+        assert kf_file["Append"]["key"] == [4, 5, 1, 2, 3]
+        assert other["Append"]["key"] == [4, 5]
+        assert kf_file["New"] is not other["New"]
+        assert kf_file["New"] == other["New"]
+
 
 class TestKeyValuesFileCache:
     @pytest.fixture